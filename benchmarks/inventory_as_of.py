@@ -0,0 +1,174 @@
+"""Times the as-of inventory query while the ingredient ledger grows.
+
+Seeds benchmark ingredients and ledger rows straight into the configured
+database, snapshotting every few rounds, and compares the snapshot + delta
+query with replaying the whole ledger, both for the current stock and for the
+stock as of the end of the first round. The latter should stay flat while
+the ledger written after it keeps growing. Run it against a scratch database with
+the migrations applied; the seeded rows are removed afterwards.
+
+    python -m benchmarks.inventory_as_of --rounds 10 --rows-per-round 100000
+"""
+
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+import typer
+from sqlalchemy import text
+from typer import echo, style
+
+from src.database.session import get_standalone_session
+from src.services import InventoryRepository
+
+app = typer.Typer()
+
+SEED_INGREDIENTS = text(
+    """
+    INSERT INTO ingredients (name, unit_id, quantity, min_threshold)
+    SELECT :prefix || g, (SELECT min(id) FROM units), 0, 0
+    FROM generate_series(1, :count) AS g
+    RETURNING id
+    """
+)
+
+SEED_MOVEMENTS = text(
+    """
+    WITH moved AS (
+        INSERT INTO ingredient_transactions
+            (ingredient_id, quantity, transaction_type, note, happened_at)
+        SELECT ids[1 + g % cardinality(ids)],
+               1 + g % 5,
+               CAST(CASE WHEN g % 3 = 0 THEN 'OUT' ELSE 'IN' END
+                    AS transaction_type_enum),
+               'benchmark',
+               :happened_at
+        FROM generate_series(1, :count) AS g,
+             (SELECT CAST(:ids AS integer[]) AS ids) AS seeded
+        RETURNING ingredient_id,
+                  CASE WHEN transaction_type = 'IN' THEN quantity
+                       ELSE -quantity END AS delta
+    )
+    UPDATE ingredients
+    SET quantity = ingredients.quantity + moved_total.delta
+    FROM (
+        SELECT ingredient_id, sum(delta) AS delta FROM moved GROUP BY ingredient_id
+    ) AS moved_total
+    WHERE ingredients.id = moved_total.ingredient_id
+    """
+)
+
+REPLAY = text(
+    """
+    SELECT ingredient_id,
+           sum(CASE WHEN transaction_type = 'IN' THEN quantity
+                    ELSE -quantity END) AS quantity
+    FROM ingredient_transactions
+    WHERE happened_at <= :at
+    GROUP BY ingredient_id
+    """
+)
+
+
+async def timed(query, repeat: int) -> tuple[float, dict[int, float]]:
+    timings = []
+    for _ in range(repeat):
+        async with get_standalone_session() as session:
+            started = time.perf_counter()
+            rows = await query(session)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), {row[0]: float(row[-1]) for row in rows}
+
+
+async def run(
+    ingredients: int, rounds: int, rows_per_round: int, snapshot_every: int, repeat: int
+) -> bool:
+    prefix = f"bench-as-of-{uuid.uuid4().hex[:8]}-"
+    async with get_standalone_session() as session:
+        result = await session.execute(
+            SEED_INGREDIENTS, {"prefix": prefix, "count": ingredients}
+        )
+        ids = [row[0] for row in result]
+
+    ok = True
+    past_at: datetime | None = None
+    echo(
+        style(
+            "ledger rows   as-of ms   replay ms   past as-of ms   past replay ms",
+            fg=typer.colors.CYAN,
+        )
+    )
+    try:
+        for round_no in range(1, rounds + 1):
+            async with get_standalone_session() as session:
+                await session.execute(
+                    SEED_MOVEMENTS,
+                    {
+                        "ids": ids,
+                        "count": rows_per_round,
+                        "happened_at": datetime.now(),
+                    },
+                )
+            if round_no % snapshot_every == 0:
+                async with get_standalone_session() as session:
+                    await InventoryRepository(session).take_snapshot()
+
+            at = datetime.now()
+            past_at = past_at or at
+            timings = []
+            for point in (at, past_at):
+                as_of_ms, as_of = await timed(
+                    lambda session: InventoryRepository(session).get_stock_as_of(point),
+                    repeat,
+                )
+                replay_ms, replay = await timed(
+                    lambda session: session.execute(REPLAY, {"at": point}), repeat
+                )
+                timings += [as_of_ms, replay_ms]
+
+                mismatched = [i for i in ids if as_of.get(i) != replay.get(i, 0.0)]
+                if mismatched:
+                    ok = False
+                    echo(
+                        style(
+                            f"  mismatch for {len(mismatched)} ingredients"
+                            f" as of {point.isoformat()}",
+                            fg=typer.colors.RED,
+                        )
+                    )
+            echo(
+                f"{round_no * rows_per_round:>11}   {timings[0]:>8.1f}   "
+                f"{timings[1]:>9.1f}   {timings[2]:>13.1f}   {timings[3]:>14.1f}"
+            )
+    finally:
+        async with get_standalone_session() as session:
+            await session.execute(
+                text("DELETE FROM ingredients WHERE id = ANY(CAST(:ids AS integer[]))"),
+                {"ids": ids},
+            )
+
+    if ok:
+        echo(
+            style(
+                "As-of stock matched the full replay.", fg=typer.colors.GREEN, bold=True
+            )
+        )
+    return ok
+
+
+@app.command(help="Compare snapshot + delta as-of queries with a full ledger replay.")
+def main(
+    ingredients: int = typer.Option(200, help="Benchmark ingredients to seed."),
+    rounds: int = typer.Option(10, help="Ledger growth rounds."),
+    rows_per_round: int = typer.Option(100_000, help="Ledger rows per round."),
+    snapshot_every: int = typer.Option(1, help="Snapshot after every N rounds."),
+    repeat: int = typer.Option(5, help="Runs per query; the median is reported."),
+):
+    ok = asyncio.run(run(ingredients, rounds, rows_per_round, snapshot_every, repeat))
+    raise typer.Exit(code=0 if ok else 1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,95 @@
+"""Measures login throughput and read latency during a login wave.
+
+Fires concurrent ``/auth/login/`` calls while a second set of clients keeps
+hitting ``/health``, then reports logins per second and the latency of the
+read requests. With hashing on the event loop the reads stall behind every
+bcrypt call; with the hashing pool they should stay in the low milliseconds.
+
+    python -m benchmarks.login_throughput --email chef@example.com
+
+``/health`` is mounted at the root and the auth routes under ``--api-prefix``.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+import typer
+from typer import echo, style
+
+app = typer.Typer()
+
+
+async def run(
+    base_url: str,
+    api_prefix: str,
+    email: str,
+    password: str,
+    logins: int,
+    concurrency: int,
+    readers: int,
+) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses: Counter[int] = Counter()
+        read_latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def login() -> None:
+            async with semaphore:
+                response = await client.post(
+                    f"{api_prefix}/auth/login/",
+                    json={"email": email, "password": password},
+                )
+                statuses[response.status_code] += 1
+
+        async def read() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                response = await client.get("/health")
+                read_latencies.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+
+        reader_tasks = [asyncio.create_task(read()) for _ in range(readers)]
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(*reader_tasks)
+
+        health = (await client.get("/health")).json()
+
+    echo(style(f"{logins} logins in {elapsed:.2f}s", fg=typer.colors.CYAN))
+    echo(f"login throughput: {logins / elapsed:.1f} req/s")
+    for code, count in sorted(statuses.items()):
+        echo(f"  HTTP {code}: {count}")
+    if read_latencies:
+        quantiles = statistics.quantiles(read_latencies, n=100)
+        echo(
+            f"reads during the wave: {len(read_latencies)}, "
+            f"p50 {quantiles[49]:.1f} ms, p95 {quantiles[94]:.1f} ms, "
+            f"max {max(read_latencies):.1f} ms"
+        )
+    if "password_hashing" in health:
+        echo(f"hashing pool: {health['password_hashing']}")
+
+
+@app.command(help="Log in concurrently while measuring read latency.")
+def main(
+    email: str = typer.Option(..., help="Account to log in as."),
+    password: str = typer.Option(..., prompt=True, hide_input=True),
+    base_url: str = typer.Option("http://localhost:8000"),
+    api_prefix: str = typer.Option("/api/v1"),
+    logins: int = typer.Option(200, help="Total login calls."),
+    concurrency: int = typer.Option(50, help="Logins in flight at once."),
+    readers: int = typer.Option(10, help="Clients polling /health meanwhile."),
+):
+    asyncio.run(
+        run(base_url, api_prefix, email, password, logins, concurrency, readers)
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,102 @@
+"""Fires concurrent ``/meals/{id}/serve/`` calls against a running server.
+
+Checks that no ingredient of the meal ends up with negative stock and reports
+the serving throughput.
+
+    python -m benchmarks.serve_meal --meal-id 1 --email chef@example.com
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+import typer
+from typer import echo, style
+
+app = typer.Typer()
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/auth/login/", json={"email": email, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def stock_levels(client: httpx.AsyncClient, meal_id: int) -> dict[str, float]:
+    response = await client.get(f"/meals/{meal_id}/ingredients")
+    response.raise_for_status()
+    return {item["name"]: item["quantity"] for item in response.json()}
+
+
+async def run(
+    base_url: str,
+    email: str,
+    password: str,
+    meal_id: int,
+    requests: int,
+    concurrency: int,
+    portions: int,
+) -> bool:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        token = await login(client, email, password)
+        client.headers["Authorization"] = f"Bearer {token}"
+        before = await stock_levels(client, meal_id)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses: Counter[int] = Counter()
+
+        async def serve() -> None:
+            async with semaphore:
+                response = await client.post(
+                    f"/meals/{meal_id}/serve/", json={"portion_qty": portions}
+                )
+                statuses[response.status_code] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(serve() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+        after = await stock_levels(client, meal_id)
+
+    echo(style(f"{requests} requests in {elapsed:.2f}s", fg=typer.colors.CYAN))
+    echo(f"throughput: {requests / elapsed:.1f} req/s")
+    for code, count in sorted(statuses.items()):
+        echo(f"  HTTP {code}: {count}")
+    for name, quantity in after.items():
+        echo(f"  {name}: {before[name]} -> {quantity}")
+
+    negative = [name for name, quantity in after.items() if quantity < 0]
+    if negative:
+        echo(
+            style(
+                f"Negative stock for: {', '.join(negative)}",
+                fg=typer.colors.RED,
+                bold=True,
+            )
+        )
+        return False
+    echo(style("Stock never dropped below zero.", fg=typer.colors.GREEN, bold=True))
+    return True
+
+
+@app.command(help="Serve one meal concurrently and verify stock stays >= 0.")
+def main(
+    meal_id: int = typer.Option(..., help="Meal to serve."),
+    email: str = typer.Option(..., help="Chef or admin account."),
+    password: str = typer.Option(..., prompt=True, hide_input=True),
+    base_url: str = typer.Option("http://localhost:8000/api/v1"),
+    requests: int = typer.Option(500, help="Total serve calls."),
+    concurrency: int = typer.Option(200, help="Calls in flight at once."),
+    portions: int = typer.Option(1, help="portion_qty per call."),
+):
+    ok = asyncio.run(
+        run(base_url, email, password, meal_id, requests, concurrency, portions)
+    )
+    raise typer.Exit(code=0 if ok else 1)
+
+
+if __name__ == "__main__":
+    app()
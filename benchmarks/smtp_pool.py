@@ -0,0 +1,128 @@
+"""Measures email throughput with and without the SMTP connection pool.
+
+Starts a local aiosmtpd server (with AUTH, optionally slowed down to mimic a
+remote provider's handshake latency) and sends the same messages from a
+thread pool, once opening a connection + login per message as the tasks used
+to, and once through ``SMTPPool``.
+
+    pip install aiosmtpd
+    python -m benchmarks.smtp_pool --messages 500 --workers 8 --latency-ms 20
+"""
+
+import asyncio
+import smtplib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+
+import typer
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult, SMTP
+from typer import echo, style
+
+from src.tasks.smtp_pool import SMTPPool
+
+app = typer.Typer()
+
+# aiosmtpd logs a deprecation warning of its own on every successful AUTH.
+logging.getLogger("mail.log").setLevel(logging.ERROR)
+
+USERNAME, PASSWORD = "bench", "bench"
+
+
+class SlowSMTP(SMTP):
+    """Delays the greeting and AUTH to stand in for a remote handshake."""
+
+    latency: float = 0.0
+
+    async def smtp_EHLO(self, arg):
+        await asyncio.sleep(self.latency)
+        return await super().smtp_EHLO(arg)
+
+    async def smtp_AUTH(self, arg):
+        await asyncio.sleep(self.latency)
+        return await super().smtp_AUTH(arg)
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+class BenchController(Controller):
+    def __init__(self, handler, latency: float, **kwargs):
+        self.latency = latency
+        super().__init__(handler, **kwargs)
+
+    def factory(self):
+        server = SlowSMTP(
+            self.handler,
+            authenticator=lambda *args: AuthResult(success=True),
+            auth_require_tls=False,
+        )
+        server.latency = self.latency
+        return server
+
+
+def build_message(number: int) -> MIMEText:
+    msg = MIMEText(f"<p>Benchmark message {number}</p>", "html")
+    msg["Subject"] = f"Benchmark {number}"
+    msg["From"] = "bench@example.com"
+    msg["To"] = "admin@example.com"
+    return msg
+
+
+def send_unpooled(host: str, port: int, msg: MIMEText) -> None:
+    with smtplib.SMTP(host, port) as server:
+        server.login(USERNAME, PASSWORD)
+        server.send_message(msg)
+
+
+def measure(send, messages: int, workers: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send, (build_message(n) for n in range(messages))))
+    return messages / (time.perf_counter() - started)
+
+
+@app.command(help="Compare per-message SMTP logins with the pooled connections.")
+def main(
+    messages: int = typer.Option(500, help="Messages per run."),
+    workers: int = typer.Option(8, help="Sending threads."),
+    pool_size: int = typer.Option(4, help="SMTPPool size."),
+    latency_ms: int = typer.Option(20, help="Delay added to EHLO and AUTH."),
+    port: int = typer.Option(8025),
+):
+    handler = CountingHandler()
+    controller = BenchController(
+        handler, latency_ms / 1000, hostname="127.0.0.1", port=port
+    )
+    controller.start()
+    try:
+        unpooled = measure(
+            lambda msg: send_unpooled("127.0.0.1", port, msg), messages, workers
+        )
+        pool = SMTPPool(
+            "127.0.0.1", port, USERNAME, PASSWORD, use_tls=False, size=pool_size
+        )
+        pooled = measure(pool.send_message, messages, workers)
+        pool.reset()
+    finally:
+        controller.stop()
+
+    echo(style(f"{messages} messages, {workers} threads", fg=typer.colors.CYAN))
+    echo(f"connection per message: {unpooled:8.1f} msg/s")
+    echo(f"pooled ({pool_size} connections): {pooled:8.1f} msg/s")
+    echo(f"server received: {handler.received}")
+    if handler.received != messages * 2:
+        echo(style("Some messages were lost.", fg=typer.colors.RED, bold=True))
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -7,10 +7,12 @@ from sqlalchemy.future import select
 
 from src.database.session import get_standalone_session
 from src.models import User
+from src.services import InventoryRepository, ReportRepository, UserRepository
 from src.utils.security import security
 
 app = Typer()
 
+
 def get_event_loop():
     try:
         return asyncio.get_event_loop()
@@ -87,8 +89,9 @@ def createsuperuser():
     echo(style(f"Name: {first_name} {last_name}", fg=typer.colors.BLUE))
     echo(style(f"Email: {email}", fg=typer.colors.BLUE))
     event_loop = get_event_loop()
-    event_loop.run_until_complete(create_superuser(first_name, last_name, email, password))
-
+    event_loop.run_until_complete(
+        create_superuser(first_name, last_name, email, password)
+    )
 
 
 @app.command(help="See all superusers.")
@@ -115,5 +118,75 @@ def allsuperusers():
             )
 
 
+async def change_user_role(email: str, role_id: int) -> None:
+    async with get_standalone_session() as session:
+        user_repository = UserRepository(session)
+        user = await user_repository.get_user_by_email(email)
+        if user is None:
+            echo(style("User not found.", fg=typer.colors.RED, bold=True))
+            return
+        await user_repository.change_role(user.id, role_id)
+        echo(
+            style(
+                f"Role of {email} set to {role_id}; existing tokens revoked.",
+                fg=typer.colors.GREEN,
+                bold=True,
+            )
+        )
+
+
+@app.command(help="Change a user's role and revoke their tokens.")
+def setrole(email: str, role_id: int):
+    event_loop = get_event_loop()
+    event_loop.run_until_complete(change_user_role(email, role_id))
+
+
+async def rebuild_meal_log_rollup() -> int:
+    async with get_standalone_session() as session:
+        return await ReportRepository(session).rebuild_daily_rollup()
+
+
+@app.command(help="Rebuild the daily meal-log rollup from meal_logs.")
+def backfillrollup():
+    event_loop = get_event_loop()
+    rows = event_loop.run_until_complete(rebuild_meal_log_rollup())
+    echo(style(f"Rollup rebuilt: {rows} rows.", fg=typer.colors.GREEN, bold=True))
+
+
+async def build_report(year: int, month: int):
+    async with get_standalone_session() as session:
+        return await ReportRepository(session).upsert_monthly_report(year, month)
+
+
+@app.command(help="Build (or rebuild) the monthly report of the given month.")
+def buildreport(year: int, month: int):
+    event_loop = get_event_loop()
+    report = event_loop.run_until_complete(build_report(year, month))
+    echo(
+        style(
+            f"Report {report.report_year}-{report.report_month:02d}: "
+            f"{report.total_served_portions} served, "
+            f"{report.possible_served_portions} possible, "
+            f"{report.difference_percentage}% difference.",
+            fg=typer.colors.GREEN,
+            bold=True,
+        )
+    )
+
+
+async def snapshot_inventory():
+    async with get_standalone_session() as session:
+        return await InventoryRepository(session).take_snapshot()
+
+
+@app.command(help="Snapshot the current stock of every ingredient.")
+def snapshotstock():
+    event_loop = get_event_loop()
+    rows = event_loop.run_until_complete(snapshot_inventory())
+    echo(
+        style(f"Snapshot taken: {rows} ingredients.", fg=typer.colors.GREEN, bold=True)
+    )
+
+
 if __name__ == "__main__":
     app()
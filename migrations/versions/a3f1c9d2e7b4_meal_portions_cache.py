@@ -0,0 +1,70 @@
+"""meal portions cache
+
+Revision ID: a3f1c9d2e7b4
+Revises: 62e8b6292747
+Create Date: 2026-10-18 09:12:40.118532
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c9d2e7b4"
+down_revision: Union[str, None] = "62e8b6292747"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "meal_portions",
+        sa.Column("meal_id", sa.Integer(), nullable=False),
+        sa.Column("portion_count", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["meal_id"], ["meals.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("meal_id"),
+    )
+    op.create_index(
+        op.f("ix_meal_ingredients_ingredient_id"),
+        "meal_ingredients",
+        ["ingredient_id"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO meal_portions (meal_id, portion_count)
+        SELECT meals.id,
+               coalesce(greatest(floor(min(ingredients.quantity
+                                           / meal_ingredients.required_qty)), 0), 0)
+        FROM meals
+        LEFT OUTER JOIN meal_ingredients ON meal_ingredients.meal_id = meals.id
+        LEFT OUTER JOIN ingredients ON ingredients.id = meal_ingredients.ingredient_id
+        GROUP BY meals.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_meal_ingredients_ingredient_id"), table_name="meal_ingredients"
+    )
+    op.drop_table("meal_portions")
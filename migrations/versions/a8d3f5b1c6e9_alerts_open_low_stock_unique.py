@@ -0,0 +1,47 @@
+"""alerts open low stock unique
+
+Revision ID: a8d3f5b1c6e9
+Revises: f1c6a8e2b4d7
+Create Date: 2026-10-18 16:07:33.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3f5b1c6e9"
+down_revision: Union[str, None] = "f1c6a8e2b4d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest open low-stock alert per ingredient.
+    op.execute(
+        """
+        UPDATE alerts SET is_resolved = true, resolved_at = LOCALTIMESTAMP
+        WHERE alert_type = 'LOW_STOCK' AND NOT is_resolved
+          AND id NOT IN (
+              SELECT max(id) FROM alerts
+              WHERE alert_type = 'LOW_STOCK' AND NOT is_resolved
+              GROUP BY ingredient_id
+          )
+        """
+    )
+    op.create_index(
+        "uq_alerts_open_low_stock",
+        "alerts",
+        ["ingredient_id"],
+        unique=True,
+        postgresql_where=sa.text("alert_type = 'LOW_STOCK' AND NOT is_resolved"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_alerts_open_low_stock", table_name="alerts")
@@ -0,0 +1,34 @@
+"""meal logs served_at index
+
+Revision ID: b7d2e4f6a8c1
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-18 11:02:15.604211
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e4f6a8c1"
+down_revision: Union[str, None] = "a3f1c9d2e7b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_meal_logs_served_at_meal_id",
+        "meal_logs",
+        ["served_at", "meal_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_meal_logs_served_at_meal_id", table_name="meal_logs")
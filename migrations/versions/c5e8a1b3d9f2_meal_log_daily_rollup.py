@@ -0,0 +1,59 @@
+"""meal log daily rollup
+
+Revision ID: c5e8a1b3d9f2
+Revises: b7d2e4f6a8c1
+Create Date: 2026-10-18 12:40:51.337904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e8a1b3d9f2"
+down_revision: Union[str, None] = "b7d2e4f6a8c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "meal_log_daily",
+        sa.Column("served_on", sa.Date(), nullable=False),
+        sa.Column("meal_id", sa.Integer(), nullable=False),
+        sa.Column("total_portions", sa.Integer(), nullable=False),
+        sa.Column("servings", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["meal_id"], ["meals.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("served_on", "meal_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO meal_log_daily (served_on, meal_id, total_portions, servings)
+        SELECT CAST(served_at AS DATE), meal_id, sum(portion_qty), count(*)
+        FROM meal_logs
+        GROUP BY CAST(served_at AS DATE), meal_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("meal_log_daily")
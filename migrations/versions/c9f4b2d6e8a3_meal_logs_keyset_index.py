@@ -0,0 +1,34 @@
+"""meal logs keyset index
+
+Revision ID: c9f4b2d6e8a3
+Revises: b2e7c4a9d1f8
+Create Date: 2026-10-18 19:02:41.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9f4b2d6e8a3"
+down_revision: Union[str, None] = "b2e7c4a9d1f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_meal_logs_meal_id_served_at_id",
+        "meal_logs",
+        ["meal_id", "served_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_meal_logs_meal_id_served_at_id", table_name="meal_logs")
@@ -0,0 +1,35 @@
+"""reports unique month
+
+Revision ID: d2a7f3c8e1b6
+Revises: c5e8a1b3d9f2
+Create Date: 2026-10-18 14:05:27.871042
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a7f3c8e1b6"
+down_revision: Union[str, None] = "c5e8a1b3d9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_unique_constraint(
+        "reports_report_year_report_month_key",
+        "reports",
+        ["report_year", "report_month"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "reports_report_year_report_month_key", "reports", type_="unique"
+    )
@@ -0,0 +1,48 @@
+"""trigram search indexes
+
+Revision ID: d6a1e9c3f7b5
+Revises: c9f4b2d6e8a3
+Create Date: 2026-10-18 19:40:12.804417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6a1e9c3f7b5"
+down_revision: Union[str, None] = "c9f4b2d6e8a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ("ix_meals_name_trgm", "meals", "name"),
+    ("ix_ingredients_name_trgm", "ingredients", "name"),
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+    ("ix_users_email_trgm", "users", "email"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
+    # pg_trgm stays installed; other database objects may rely on it.
@@ -0,0 +1,37 @@
+"""ingredient transactions keyset index
+
+Revision ID: e4b9c1d7f3a5
+Revises: d2a7f3c8e1b6
+Create Date: 2026-10-18 14:48:09.337120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9c1d7f3a5"
+down_revision: Union[str, None] = "d2a7f3c8e1b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_ingredient_transactions_ingredient_id_id",
+        "ingredient_transactions",
+        ["ingredient_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_ingredient_transactions_ingredient_id_id",
+        table_name="ingredient_transactions",
+    )
@@ -0,0 +1,73 @@
+"""ingredient snapshots
+
+Revision ID: f1c6a8e2b4d7
+Revises: e4b9c1d7f3a5
+Create Date: 2026-10-18 15:21:44.902615
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c6a8e2b4d7"
+down_revision: Union[str, None] = "e4b9c1d7f3a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ingredient_snapshots",
+        sa.Column("ingredient_id", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("last_transaction_id", sa.Integer(), nullable=False),
+        sa.Column("taken_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["ingredient_id"], ["ingredients.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_ingredient_snapshots_ingredient_id_taken_at",
+        "ingredient_snapshots",
+        ["ingredient_id", "taken_at"],
+        unique=False,
+    )
+    # Stock from before the ledger existed only survives as current quantity.
+    op.execute(
+        """
+        INSERT INTO ingredient_snapshots
+            (ingredient_id, quantity, last_transaction_id, taken_at)
+        SELECT id, quantity,
+               (SELECT coalesce(max(id), 0) FROM ingredient_transactions),
+               LOCALTIMESTAMP
+        FROM ingredients
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_ingredient_snapshots_ingredient_id_taken_at",
+        table_name="ingredient_snapshots",
+    )
+    op.drop_table("ingredient_snapshots")
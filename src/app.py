@@ -2,9 +2,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from src.cache.autocomplete import autocomplete_index
+from src.cache.catalog_cache import catalog_cache
 from src.config.settings import get_settings, Settings
 from src.init import init
 from src.routers import api_v1_router
+from src.tasks.schedule import lifespan as scheduler_lifespan
+from src.utils.password_hasher import password_hasher
 from src.websockets import api_v1_websocket
 
 settings: Settings = get_settings()
@@ -12,7 +16,12 @@ settings: Settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    yield
+    async with (
+        scheduler_lifespan(app),
+        autocomplete_index.running(),
+        catalog_cache.running(),
+    ):
+        yield
 
 
 def create_app() -> CORSMiddleware:
@@ -35,7 +44,7 @@ def create_app() -> CORSMiddleware:
 
     @app.get("/health", tags=["Health Check"])
     async def health_check():
-        return {"status": "ok"}
+        return {"status": "ok", "password_hashing": password_hasher.stats()}
 
     return CORSMiddleware(
         app=app,
@@ -0,0 +1,161 @@
+import asyncio
+import heapq
+import logging
+import re
+from bisect import bisect_left, insort
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any, AsyncIterator, Iterable
+
+from src.config.settings import Settings, get_settings
+from src.database.session import get_standalone_session
+from src.services import IngredientRepository, MealRepository
+from src.utils.events import catalog_events
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+WORD = re.compile(r"\w+")
+
+
+class AutocompleteIndex:
+    """Meal and ingredient names held in memory for prefix lookups.
+
+    Every name is indexed under its whole case-folded text and under each of
+    its words, in one sorted list of ``(token, kind, id)`` keys: a lookup is
+    a binary search to the first token with the prefix and a scan over the
+    matching ones, with no database round trip. The names are loaded at
+    startup, kept current from ``catalog_events`` and reloaded every
+    ``AUTOCOMPLETE_RESYNC_SECONDS`` in case an event got lost.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[str, str, int]] = []
+        self._names: dict[tuple[str, int], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def _tokens(name: str) -> set[str]:
+        folded = name.casefold()
+        return {folded, *WORD.findall(folded)}
+
+    def replace(self, entries: Iterable[tuple[str, int, str]]) -> None:
+        """Swaps in a complete set of ``(kind, id, name)`` entries."""
+        names = {(kind, item_id): name for kind, item_id, name in entries}
+        self._keys = sorted(
+            (token, kind, item_id)
+            for (kind, item_id), name in names.items()
+            for token in self._tokens(name)
+        )
+        self._names = names
+
+    def upsert(self, kind: str, item_id: int, name: str) -> None:
+        self.remove(kind, item_id)
+        self._names[(kind, item_id)] = name
+        for token in self._tokens(name):
+            insort(self._keys, (token, kind, item_id))
+
+    def remove(self, kind: str, item_id: int) -> None:
+        name = self._names.pop((kind, item_id), None)
+        if name is None:
+            return
+        for token in self._tokens(name):
+            key = (token, kind, item_id)
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def apply(self, event: dict[str, Any]) -> None:
+        if event["kind"] not in ("meal", "ingredient"):
+            return
+        if event.get("name") is None:
+            self.remove(event["kind"], event["id"])
+        else:
+            self.upsert(event["kind"], event["id"], event["name"])
+
+    def search(
+        self, prefix: str, kinds: Iterable[str] | None = None, limit: int = 10
+    ) -> list[tuple[str, int, str]]:
+        """Up to ``limit`` ``(kind, id, name)`` whose name or a word of it
+        starts with ``prefix``. Whole-name matches come first, then shorter
+        names."""
+        prefix = prefix.strip().casefold()
+        if not prefix:
+            return []
+        kinds = set(kinds) if kinds is not None else None
+        ranked: dict[tuple[str, int], tuple] = {}
+        position = bisect_left(self._keys, (prefix,))
+        while position < len(self._keys):
+            token, kind, item_id = self._keys[position]
+            if not token.startswith(prefix):
+                break
+            position += 1
+            if kinds is not None and kind not in kinds:
+                continue
+            name = self._names[(kind, item_id)]
+            folded = name.casefold()
+            ranked[(kind, item_id)] = (
+                not folded.startswith(prefix),
+                len(folded),
+                folded,
+                kind,
+                item_id,
+            )
+        return [
+            (kind, item_id, self._names[(kind, item_id)])
+            for *_, kind, item_id in heapq.nsmallest(limit, ranked.values())
+        ]
+
+    async def reload(self) -> None:
+        async with get_standalone_session() as session:
+            meals = await MealRepository(session).get_names()
+            ingredients = await IngredientRepository(session).get_names()
+        self.replace(
+            [("meal", meal_id, name) for meal_id, name in meals]
+            + [
+                ("ingredient", ingredient_id, name)
+                for ingredient_id, name in ingredients
+            ]
+        )
+
+    async def _safe_reload(self) -> None:
+        try:
+            await self.reload()
+        except Exception as e:
+            logger.error(f"Loading autocomplete names failed: {e}")
+
+    async def _run(self, events: asyncio.Queue) -> None:
+        resync_at = monotonic() + settings.AUTOCOMPLETE_RESYNC_SECONDS
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    events.get(), timeout=max(0.0, resync_at - monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+            else:
+                self.apply(event)
+            if monotonic() >= resync_at:
+                await self._safe_reload()
+                resync_at = monotonic() + settings.AUTOCOMPLETE_RESYNC_SECONDS
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator["AutocompleteIndex"]:
+        """Loads the names and follows catalog changes while the app runs.
+
+        The subscription comes first, so a change committed while the names
+        load is applied on top of them rather than lost.
+        """
+        async with catalog_events.subscribe() as events:
+            await self._safe_reload()
+            task = asyncio.create_task(self._run(events))
+            try:
+                yield self
+            finally:
+                task.cancel()
+
+
+autocomplete_index = AutocompleteIndex()
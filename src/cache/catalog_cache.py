@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+
+from src.cache.ttl_cache import TTLCache
+from src.config.settings import Settings, get_settings
+from src.database.redis import get_redis
+from src.utils.events import catalog_events
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+# Catalog events that change what is cached here; ingredient events do not.
+CACHED_KINDS = ("meal", "recipe")
+
+
+class CatalogCache:
+    """Serialized meal catalog responses, dropped as a whole on every write.
+
+    Values are ready-to-send JSON bytes, so a hit skips the ORM and pydantic
+    alike. The catalog has one version number: meal repository writes call
+    ``invalidate`` after committing, which bumps it and clears this process'
+    entries, and other workers follow through ``catalog_events``. A value
+    loaded while the version moved on is returned but not cached, so a read
+    racing a write cannot pin the old data.
+
+    With ``CATALOG_CACHE_REDIS`` the version is a Redis counter and entries
+    are shared between workers under ``catalog:<version>:<key>``, so a bump
+    orphans all of them at once and they simply expire. Should the bump
+    fail, the shared entries are deleted instead, and if that fails too the
+    write is reported as not fully applied. Local entries are dropped on
+    every catalog event whatever the version says.
+    """
+
+    VERSION_KEY = "catalog:version"
+
+    def __init__(self) -> None:
+        self._local: TTLCache[str, bytes] = TTLCache(
+            maxsize=settings.CATALOG_CACHE_SIZE,
+            ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+        )
+        # None while the shared version is unknown; the shared entries are
+        # not used then.
+        self.version: int | None = 0
+        # Bumped whenever local entries are dropped, shared version or not.
+        self._generation = 0
+
+    def _redis_key(self, version: int, key: str) -> str:
+        return f"catalog:{version}:{key}"
+
+    async def get_or_load(
+        self, key: str, load: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        version, generation = self.version, self._generation
+        shared = settings.CATALOG_CACHE_REDIS and version is not None
+        if shared:
+            try:
+                raw = await get_redis().get(self._redis_key(version, key))
+            except RedisError as e:
+                logger.warning(f"Reading cached catalog entry {key} failed: {e}")
+                raw = None
+            if raw is not None:
+                value = raw.encode()
+                if (version, generation) == (self.version, self._generation):
+                    self._local.set(key, value)
+                return value
+
+        value = await load()
+        if (version, generation) != (self.version, self._generation):
+            return value
+        self._local.set(key, value)
+        if shared:
+            try:
+                await get_redis().set(
+                    self._redis_key(version, key),
+                    value,
+                    ex=settings.CATALOG_CACHE_TTL_SECONDS,
+                )
+            except RedisError as e:
+                logger.warning(f"Caching catalog entry {key} failed: {e}")
+        return value
+
+    def _clear_local(self) -> None:
+        self._generation += 1
+        self._local.clear()
+
+    async def invalidate(self) -> None:
+        """Drops every entry; call after committing a catalog write."""
+        self._clear_local()
+        if not settings.CATALOG_CACHE_REDIS:
+            self.version += 1
+            return
+        redis = get_redis()
+        try:
+            self.version = await redis.incr(self.VERSION_KEY)
+            return
+        except RedisError as e:
+            logger.error(f"Bumping the catalog version failed: {e}")
+        self.version = None
+        try:
+            # Other workers keep the old version; take its entries away.
+            async for key in redis.scan_iter(match="catalog:*:*"):
+                await redis.delete(key)
+        except RedisError as e:
+            logger.error(f"Dropping shared catalog entries failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="The change was saved, but other workers may still "
+                "serve the previous catalog for a while.",
+            )
+
+    async def _sync(self) -> None:
+        """Catches up with a write made by another worker."""
+        self._clear_local()
+        if not settings.CATALOG_CACHE_REDIS:
+            self.version += 1
+            return
+        try:
+            raw = await get_redis().get(self.VERSION_KEY)
+        except RedisError as e:
+            logger.warning(f"Reading the catalog version failed: {e}")
+            self.version = None
+        else:
+            self.version = int(raw or 0)
+
+    async def _run(self) -> None:
+        async with catalog_events.subscribe() as events:
+            while True:
+                event = await events.get()
+                if event.get("kind") in CACHED_KINDS:
+                    await self._sync()
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator["CatalogCache"]:
+        """Follows catalog writes of other workers while the app runs."""
+        await self._sync()
+        task = asyncio.create_task(self._run())
+        try:
+            yield self
+        finally:
+            task.cancel()
+
+
+catalog_cache = CatalogCache()
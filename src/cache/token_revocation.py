@@ -0,0 +1,73 @@
+import logging
+from time import time
+
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+
+from src.cache.ttl_cache import TTLCache
+from src.config.settings import Settings, get_settings
+from src.database.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+
+class TokenRevocationList:
+    """Per-user cut-off time before which issued tokens are rejected.
+
+    Self-contained access tokens carry the user's role, so a role change or a
+    deleted account must make the tokens issued before it unusable. The
+    cut-off is stored in Redis for the refresh-token lifetime and looked up at
+    most every ``REVOCATION_CHECK_SECONDS`` per user and worker.
+
+    The cut-off is kept in whole seconds, like the tokens' ``iat``, and is
+    the second after the revocation: a token minted earlier in that same
+    second must not keep the old role, so one minted just after it is
+    rejected too. Both sides fail closed; without Redis a revocation could
+    not reach the other workers, nor could a token be checked against one.
+    """
+
+    def __init__(self) -> None:
+        self._local: TTLCache[int, int] = TTLCache(
+            maxsize=settings.USER_CACHE_SIZE,
+            ttl=settings.REVOCATION_CHECK_SECONDS,
+        )
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"revoked:{user_id}"
+
+    async def revoke_user(self, user_id: int) -> None:
+        revoked_at = int(time()) + 1
+        self._local.set(user_id, revoked_at)
+        try:
+            await get_redis().set(
+                self._key(user_id),
+                revoked_at,
+                ex=settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60,
+            )
+        except RedisError as e:
+            logger.error(f"Revoking tokens of user {user_id} failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="The user's tokens could not be revoked, please retry.",
+            )
+
+    async def is_revoked(self, user_id: int, issued_at: int) -> bool:
+        revoked_at = self._local.get(user_id)
+        if revoked_at is None:
+            try:
+                raw = await get_redis().get(self._key(user_id))
+            except RedisError as e:
+                logger.error(f"Checking revocation of user {user_id} failed: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Token revocation cannot be checked right now.",
+                )
+            revoked_at = int(float(raw)) if raw is not None else 0
+            self._local.set(user_id, revoked_at)
+        return issued_at < revoked_at
+
+
+token_revocation = TokenRevocationList()
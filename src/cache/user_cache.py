@@ -0,0 +1,93 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from src.cache.ttl_cache import TTLCache
+from src.config.settings import Settings, get_settings
+from src.database.redis import get_redis
+from src.models import User
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+
+class UserCache:
+    """Authenticated users by id, so token checks can skip the database.
+
+    Entries live in a per-process LRU and, with ``USER_CACHE_REDIS`` enabled,
+    in Redis as well so that workers share them. Writes to a user must call
+    ``invalidate``; other workers' local copies then expire within
+    ``USER_CACHE_TTL_SECONDS``. The password hash is never cached.
+    """
+
+    FIELDS = (
+        "id",
+        "first_name",
+        "last_name",
+        "profile_picture",
+        "email",
+        "is_active",
+        "role_id",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(self) -> None:
+        self._local: TTLCache[int, dict[str, Any]] = TTLCache(
+            maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+        )
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    async def get(self, user_id: int) -> User | None:
+        fields = self._local.get(user_id)
+        if fields is None and settings.USER_CACHE_REDIS:
+            try:
+                raw = await get_redis().get(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Reading cached user {user_id} failed: {e}")
+                raw = None
+            if raw is not None:
+                fields = json.loads(raw)
+                self._local.set(user_id, fields)
+        if fields is None:
+            return None
+        return User(
+            **{
+                **fields,
+                "created_at": datetime.fromisoformat(fields["created_at"]),
+                "updated_at": datetime.fromisoformat(fields["updated_at"]),
+            }
+        )
+
+    async def set(self, user: User) -> None:
+        fields = {name: getattr(user, name) for name in self.FIELDS}
+        fields["created_at"] = user.created_at.isoformat()
+        fields["updated_at"] = user.updated_at.isoformat()
+        self._local.set(user.id, fields)
+        if settings.USER_CACHE_REDIS:
+            try:
+                await get_redis().set(
+                    self._key(user.id),
+                    json.dumps(fields),
+                    ex=settings.USER_CACHE_TTL_SECONDS,
+                )
+            except RedisError as e:
+                logger.warning(f"Caching user {user.id} failed: {e}")
+
+    async def invalidate(self, user_id: int) -> None:
+        self._local.pop(user_id)
+        if settings.USER_CACHE_REDIS:
+            try:
+                await get_redis().delete(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Invalidating cached user {user_id} failed: {e}")
+
+
+user_cache = UserCache()
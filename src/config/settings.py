@@ -34,11 +34,51 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
 
+    # Authenticated User Cache
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_SIZE: int = 4096
+    USER_CACHE_REDIS: bool = False  # Share cached users between workers
+    REVOCATION_CHECK_SECONDS: int = 5
+    OTP_TTL_SECONDS: int = 300
+    OTP_MAX_ATTEMPTS: int = 5
+    BCRYPT_ROUNDS: int = 12  # Existing hashes are upgraded on the next login
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE: int = 64  # Waiting hashes before sign-ins get a 503
+
     # Email Service Credentials
     EMAIL_PASSWORD: str
     EMAIL: str  # Use Pydantic's EmailStr for validation
     SMTP_PORT: int = 587
     SMTP_SERVER: str
+    SMTP_USE_TLS: bool = True
+    SMTP_POOL_SIZE: int = 4  # Connections kept per worker process
+    SMTP_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    SMTP_POOL_MAX_IDLE_SECONDS: int = 60  # Older idle connections are reopened
+    SMTP_BULK_CHUNK_SIZE: int = 50  # Bulk messages sent per connection checkout
+    SMTP_RATE_PER_SECOND: float = 10  # Per provider and worker process
+    SMTP_RATE_BURST: int = 20
+
+    # Meal Catalog Cache
+    CATALOG_CACHE_SIZE: int = 1024
+    CATALOG_CACHE_TTL_SECONDS: int = 60 * 60  # Writes invalidate entries anyway
+    CATALOG_CACHE_REDIS: bool = False  # Share cached responses between workers
+
+    # Stock Handling
+    # Lock the served ingredients (in id order) before decrementing them
+    SERVE_ROW_LOCKING: bool = True
+
+    # Change Notifications
+    EVENTS_BACKEND: str = "redis"  # "redis" or "memory" (single process)
+    WAREHOUSE_RESYNC_SECONDS: int = 60
+    AUTOCOMPLETE_RESYNC_SECONDS: int = 300  # Reload names even if events got lost
+
+    # Inventory History
+    INVENTORY_SNAPSHOT_SECONDS: int = 60 * 60 * 24
+
+    # List Totals
+    # Unfiltered listings of bigger tables report the planner's row estimate
+    PAGINATION_ESTIMATE_THRESHOLD: int = 100_000
+    PAGINATION_ESTIMATE_TTL_SECONDS: int = 300
 
     # Pydantic settings configuration
     model_config = SettingsConfigDict(
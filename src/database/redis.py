@@ -0,0 +1,13 @@
+from functools import cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings, Settings
+
+settings: Settings = get_settings()
+
+
+@cache
+def get_redis() -> Redis:
+    """Creates and returns a cached asyncio Redis client."""
+    return Redis.from_url(settings.redis_url, decode_responses=True)
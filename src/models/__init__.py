@@ -1,11 +1,11 @@
 from src.database.base_model import Base, BaseModel
 from src.models.units import Unit
-from src.models.users import Role, User, UserOTP
+from src.models.users import Role, User
 from src.models.ingredients import Ingredient
-from src.models.transactions import IngredientTransaction
-from src.models.meals import Meal, MealIngredient, MealLog
+from src.models.transactions import IngredientSnapshot, IngredientTransaction
+from src.models.meals import Meal, MealIngredient, MealLog, MealPortion
 from src.models.alerts import Alert
-from src.models.reports import Report
+from src.models.reports import Report, MealLogDaily
 
 __all__ = [
     # base
@@ -14,17 +14,19 @@ __all__ = [
     # auth / users
     "Role",
     "User",
-    "UserOTP",
     # reference
     "Unit",
     # stock
     "Ingredient",
     "IngredientTransaction",
+    "IngredientSnapshot",
     "Alert",
     # recipes
     "Meal",
     "MealIngredient",
     "MealLog",
+    "MealPortion",
     # analytics
     "Report",
+    "MealLogDaily",
 ]
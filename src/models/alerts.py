@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base_model import BaseModel
@@ -14,6 +14,14 @@ if TYPE_CHECKING:
 
 class Alert(BaseModel):
     __tablename__ = "alerts"
+    __table_args__ = (
+        Index(
+            "uq_alerts_open_low_stock",
+            "ingredient_id",
+            unique=True,
+            postgresql_where=text("alert_type = 'LOW_STOCK' AND NOT is_resolved"),
+        ),
+    )
 
     ingredient_id: Mapped[int] = mapped_column(
         ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False
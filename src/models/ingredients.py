@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from datetime import datetime
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base_model import BaseModel
@@ -17,6 +17,14 @@ if TYPE_CHECKING:
 
 class Ingredient(BaseModel):
     __tablename__ = "ingredients"
+    __table_args__ = (
+        Index(
+            "ix_ingredients_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, Numeric, String, DateTime, func
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, String, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base_model import BaseModel
@@ -16,6 +16,14 @@ if TYPE_CHECKING:
 
 class Meal(BaseModel):
     __tablename__ = "meals"
+    __table_args__ = (
+        Index(
+            "ix_meals_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     picture: Mapped[str | None] = mapped_column(String(100))
@@ -48,7 +56,7 @@ class MealIngredient(BaseModel):
         ForeignKey("meals.id", ondelete="CASCADE"), nullable=False
     )
     ingredient_id: Mapped[int] = mapped_column(
-        ForeignKey("ingredients.id"), nullable=False
+        ForeignKey("ingredients.id"), nullable=False, index=True
     )
 
     required_qty: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
@@ -69,8 +77,32 @@ class MealIngredient(BaseModel):
         }
 
 
+class MealPortion(BaseModel):
+    """Cached number of portions the current stock allows for a meal."""
+
+    __tablename__ = "meal_portions"
+
+    meal_id: Mapped[int] = mapped_column(
+        ForeignKey("meals.id", ondelete="CASCADE"), unique=True, nullable=False
+    )
+    portion_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "meal_id": self.meal_id,
+            "portion_count": self.portion_count,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
 class MealLog(BaseModel):
     __tablename__ = "meal_logs"
+    __table_args__ = (
+        Index("ix_meal_logs_served_at_meal_id", "served_at", "meal_id"),
+        Index("ix_meal_logs_meal_id_served_at_id", "meal_id", "served_at", "id"),
+    )
 
     meal_id: Mapped[int] = mapped_column(ForeignKey("meals.id"), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
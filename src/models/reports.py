@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from datetime import date
 
-from sqlalchemy import Integer, Numeric
+from sqlalchemy import Date, ForeignKey, Integer, Numeric, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database.base_model import BaseModel
@@ -9,6 +10,7 @@ from src.database.base_model import BaseModel
 
 class Report(BaseModel):
     __tablename__ = "reports"
+    __table_args__ = (UniqueConstraint("report_year", "report_month"),)
 
     report_month: Mapped[int] = mapped_column(Integer, nullable=False)
     report_year: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -27,3 +29,28 @@ class Report(BaseModel):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class MealLogDaily(BaseModel):
+    """Daily rollup of ``meal_logs``: one row per (day, meal)."""
+
+    __tablename__ = "meal_log_daily"
+    __table_args__ = (UniqueConstraint("served_on", "meal_id"),)
+
+    served_on: Mapped[date] = mapped_column(Date, nullable=False)
+    meal_id: Mapped[int] = mapped_column(
+        ForeignKey("meals.id", ondelete="CASCADE"), nullable=False
+    )
+    total_portions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    servings: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "served_on": self.served_on.isoformat(),
+            "meal_id": self.meal_id,
+            "total_portions": self.total_portions,
+            "servings": self.servings,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
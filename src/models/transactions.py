@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum as PythonEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Enum
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Enum, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base_model import BaseModel
@@ -20,6 +20,9 @@ class TransactionType(str, PythonEnum):
 
 class IngredientTransaction(BaseModel):
     __tablename__ = "ingredient_transactions"
+    __table_args__ = (
+        Index("ix_ingredient_transactions_ingredient_id_id", "ingredient_id", "id"),
+    )
 
     ingredient_id: Mapped[int] = mapped_column(
         ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False
@@ -37,7 +40,7 @@ class IngredientTransaction(BaseModel):
     note: Mapped[str | None] = mapped_column(String(255))
 
     happened_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, nullable=False
+        DateTime, default=func.now(), nullable=False
     )
 
     def to_dict(self) -> dict:
@@ -52,3 +55,26 @@ class IngredientTransaction(BaseModel):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class IngredientSnapshot(BaseModel):
+    """Stock of one ingredient once every ledger row up to
+    ``last_transaction_id`` has been applied."""
+
+    __tablename__ = "ingredient_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_ingredient_snapshots_ingredient_id_taken_at",
+            "ingredient_id",
+            "taken_at",
+        ),
+    )
+
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False
+    )
+    quantity: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
+    last_transaction_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    taken_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), nullable=False
+    )
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func, Integer
+from sqlalchemy import Boolean, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base_model import BaseModel
@@ -42,6 +41,26 @@ class User(BaseModel):
     """Represents a user account in the system."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     first_name: Mapped[str] = mapped_column(String(100))
@@ -65,9 +84,6 @@ class User(BaseModel):
     role: Mapped["Role"] = relationship(
         "Role", back_populates="users", lazy="joined"
     )  # Eager load role
-    otp_codes: Mapped[List["UserOTP"]] = relationship(
-        "UserOTP", back_populates="user", cascade="all, delete-orphan", lazy="select"
-    )
     meal_logs: Mapped[List["MealLog"]] = relationship(
         "MealLog", back_populates="user", lazy="select"
     )
@@ -101,60 +117,3 @@ class User(BaseModel):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
-
-
-class UserOTP(BaseModel):
-    """Stores One-Time Passwords (OTP) for user verification."""
-
-    __tablename__ = "user_otp"
-
-    id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
-    otp_code: Mapped[int] = mapped_column(
-        Integer, nullable=False
-    )  # Store OTP as string if needed
-    # Use server_default for dynamic defaults like current time + delta
-    expires_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        # server_default=func.now() + datetime.timedelta(minutes=5) # Use server-side default if possible
-        # Python-side default factory (less ideal for distributed systems):
-        default=lambda: datetime.datetime.now(datetime.timezone.utc)
-        + datetime.timedelta(minutes=5),
-    )
-    created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
-    # Relationships
-    user: Mapped["User"] = relationship(
-        "User", back_populates="otp_codes", lazy="select"
-    )
-
-    def is_expired(self) -> bool:
-        """Checks if the OTP has expired."""
-        # Ensure comparison is timezone-aware
-        return datetime.datetime.now(datetime.timezone.utc) >= self.expires_at
-
-    def __repr__(self) -> str:
-        return f"<UserOTP(id={self.id}, user_id={self.user_id}, expired={self.is_expired()})>"
-
-    # Consider using Pydantic schemas for serialization
-    def to_dict(self) -> dict:
-        """Returns a dictionary representation of the UserOTP."""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            # "otp_code": self.otp_code, # Avoid exposing OTP code
-            "expires_at": self.expires_at.isoformat(),
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
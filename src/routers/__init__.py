@@ -10,6 +10,9 @@ from .position_calculation_router import (
     router as position_calculation_router,
 )
 from .report_router import router as report_router
+from .inventory_router import router as inventory_router
+from .search_router import router as search_router
+from .autocomplete_router import router as autocomplete_router
 
 api_v1_router = APIRouter()
 
@@ -21,6 +24,9 @@ api_v1_router.include_router(units_router, tags=["Units"])
 api_v1_router.include_router(alerts_router, tags=["Alerts"])
 api_v1_router.include_router(position_calculation_router, tags=["Position Calculation"])
 api_v1_router.include_router(report_router, tags=["Reports"])
+api_v1_router.include_router(inventory_router, tags=["Inventory"])
+api_v1_router.include_router(search_router, tags=["Search"])
+api_v1_router.include_router(autocomplete_router, tags=["Search"])
 
 
 __all__ = ["api_v1_router"]
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 
-from src.models import User
+from src.schemas.users_schemas import PrincipalSchema
 from src.schemas.alerts_schemas import (
     AlertsQuery,
     AlertListSchema,
@@ -8,7 +8,7 @@ from src.schemas.alerts_schemas import (
     AlertCreateSchema,
 )
 from src.services.alerts_controller import AlertsController
-from src.utils.security import get_current_user
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/alerts",
@@ -19,7 +19,7 @@ router = APIRouter(
 @router.get("", status_code=status.HTTP_200_OK, response_model=AlertListSchema)
 async def get_alerts(
     payload: AlertsQuery = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     alerts_controller: AlertsController = Depends(),
 ) -> AlertListSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -35,7 +35,7 @@ async def get_alerts(
 )
 async def get_alert_by_id(
     alert_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     alerts_controller: AlertsController = Depends(),
 ) -> AlertReadSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -49,7 +49,7 @@ async def get_alert_by_id(
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=AlertReadSchema)
 async def create_alert(
     payload: AlertCreateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     alerts_controller: AlertsController = Depends(),
 ):
     if current_user.role_id not in (1, 2, 3, 4):
@@ -63,7 +63,7 @@ async def create_alert(
 @router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_alert(
     alert_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     alerts_controller: AlertsController = Depends(),
 ):
     if current_user.role_id not in (1, 2):
@@ -81,7 +81,7 @@ async def delete_alert(
 )
 async def resolve_alert(
     alert_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     alerts_controller: AlertsController = Depends(),
 ):
     if current_user.role_id not in (1, 2):
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.cache.autocomplete import autocomplete_index
+from src.schemas.search_schemas import (
+    AutocompleteItemSchema,
+    AutocompleteSchema,
+    CatalogAutocompleteQuery,
+)
+from src.schemas.users_schemas import PrincipalSchema
+from src.utils.security import get_current_principal
+
+router = APIRouter(
+    prefix="/autocomplete",
+    tags=["autocomplete"],
+)
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=AutocompleteSchema,
+)
+async def autocomplete_catalog(
+    params: CatalogAutocompleteQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> AutocompleteSchema:
+    """Meal and ingredient names by prefix, answered from memory."""
+    if current_user.role_id not in (1, 2, 3, 4):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    matches = autocomplete_index.search(
+        params.q,
+        kinds=[params.kind.value] if params.kind else None,
+        limit=params.limit,
+    )
+    return AutocompleteSchema(
+        q=params.q,
+        items=[
+            AutocompleteItemSchema(kind=kind, id=item_id, label=name)
+            for kind, item_id, name in matches
+        ],
+    )
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 
 from src.database.session import get_standalone_session
-from src.models import User
+from src.schemas.users_schemas import PrincipalSchema
 from src.schemas.ingredients_schemas import (
     IngredientListSchema,
     IngredientListQuery,
@@ -9,10 +9,12 @@ from src.schemas.ingredients_schemas import (
     IngredientCreateSchema,
     IngredientUpdateSchema,
 )
-from src.services import IngredientRepository, UnitRepository, UserRepository
+from src.services import AlertsRepository, UserRepository
+from src.schemas.transaction_schemas import TransactionListQuery, TransactionListSchema
 from src.services.ingredient_controller import IngredientController
-from src.tasks import send_warnings
-from src.utils.security import get_current_user
+from src.services.transaction_controller import TransactionController
+from src.tasks import send_bulk
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/ingredients",
@@ -27,7 +29,7 @@ router = APIRouter(
 )
 async def get_all_ingredients(
     params: IngredientListQuery = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     ingredient_controller: IngredientController = Depends(),
 ) -> IngredientListSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -47,7 +49,7 @@ async def get_all_ingredients(
 )
 async def get_ingredient(
     ingredient_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     ingredient_controller: IngredientController = Depends(),
 ) -> IngredientReadSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -60,12 +62,34 @@ async def get_ingredient(
     )
 
 
+@router.get(
+    "/{ingredient_id}/transactions",
+    status_code=status.HTTP_200_OK,
+    response_model=TransactionListSchema,
+)
+async def get_ingredient_transactions(
+    ingredient_id: int,
+    params: TransactionListQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    transaction_controller: TransactionController = Depends(),
+) -> TransactionListSchema:
+    if current_user.role_id not in (1, 2, 4):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await transaction_controller.get_ingredient_transactions(
+        ingredient_id=ingredient_id,
+        payload=params,
+    )
+
+
 @router.post(
     "/", status_code=status.HTTP_201_CREATED, response_model=IngredientReadSchema
 )
 async def create_ingredient(
     payload: IngredientCreateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     ingredient_controller: IngredientController = Depends(),
 ) -> IngredientReadSchema:
     if current_user.role_id not in (1, 2, 4):
@@ -86,7 +110,7 @@ async def create_ingredient(
 async def update_ingredient(
     ingredient_id: int,
     payload: IngredientUpdateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     ingredient_controller: IngredientController = Depends(),
 ) -> IngredientReadSchema:
     if current_user.role_id not in (1, 2, 4):
@@ -105,7 +129,7 @@ async def update_ingredient(
 )
 async def delete_ingredient(
     ingredient_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     ingredient_controller: IngredientController = Depends(),
 ):
     if current_user.role_id not in (1, 2):
@@ -119,25 +143,25 @@ async def delete_ingredient(
 
 
 async def low_stock_ingredients() -> None:
+    """Sends every admin one digest of the ingredients that just ran low."""
     async with get_standalone_session() as session:
-        ingredient_repository = IngredientRepository(session)
-        unit_repository = UnitRepository(session)
-        ingredient_controller = IngredientController(
-            ingredient_repository=ingredient_repository,
-            unit_repository=unit_repository,
+        items = await AlertsRepository(session).sync_low_stock_alerts()
+        if not items:
+            return
+        admins = await UserRepository(session).get_admin_users()
+
+    digest = [
+        {
+            "name": item.name,
+            "quantity": str(item.quantity),
+            "min_threshold": str(item.min_threshold),
+            "unit": item.unit,
+        }
+        for item in items
+    ]
+    if admins:
+        send_bulk.delay(
+            "low_stock_digest",
+            [admin.email for admin in admins],
+            {"items": digest},
         )
-        users_repository = UserRepository(session)
-
-        limit, offset = 10, 1
-        while 1:
-            res = (
-                await ingredient_controller.low_stock_ingredients(limit, offset)
-            ).model_dump()
-            if res["total"] == 0:
-                break
-            for ingredient in res["items"]:
-                if ingredient["quantity"] <= ingredient["min_threshold"]:
-                    users = await users_repository.get_admin_users()
-                    for user in users:
-                        send_warnings.delay(user.email, ingredient["name"])
-            offset += 1
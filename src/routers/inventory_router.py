@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.database.session import get_standalone_session
+from src.schemas.inventory_schemas import InventoryAsOfQuery, InventoryAsOfSchema
+from src.schemas.users_schemas import PrincipalSchema
+from src.services import InventoryRepository
+from src.services.inventory_controller import InventoryController
+from src.utils.security import get_current_principal
+
+router = APIRouter(
+    prefix="/inventory",
+    tags=["inventory"],
+)
+
+
+@router.get(
+    "/as-of",
+    status_code=status.HTTP_200_OK,
+    response_model=InventoryAsOfSchema,
+)
+async def get_stock_as_of(
+    params: InventoryAsOfQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    inventory_controller: InventoryController = Depends(),
+) -> InventoryAsOfSchema:
+    if current_user.role_id not in (1, 2, 4):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await inventory_controller.get_stock_as_of(payload=params)
+
+
+async def take_inventory_snapshot() -> int:
+    async with get_standalone_session() as session:
+        return await InventoryRepository(session).take_snapshot()
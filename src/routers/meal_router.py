@@ -1,7 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from src.models import User
-from src.schemas.ingredients_schemas import IngredientReadSchema
+from src.schemas.users_schemas import PrincipalSchema
 from src.schemas.meal_schemas import (
     MealListQuery,
     MealListSchema,
@@ -9,13 +8,15 @@ from src.schemas.meal_schemas import (
     MealCreateSchema,
     MealUpdateSchema,
     MealReadWithIngredientSchema,
+    MealDetailSchema,
+    MealIngredientDetailSchema,
     AddIngredientToMealSchema,
     PortionQty,
     MealLogListSchema,
     MealLogReadSchema,
 )
 from src.services.meal_controller import MealController
-from src.utils.security import get_current_user
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/meals",
@@ -27,35 +28,59 @@ router = APIRouter(
 async def list_meals(
     payload: MealListQuery = Depends(),
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
-) -> MealListSchema:
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> Response:
     if current_user.role_id not in (1, 2, 3, 4):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to access this resource.",
         )
-    return await meal_controller.list_meals(payload=payload)
+    return Response(
+        await meal_controller.list_meals_json(payload=payload),
+        media_type="application/json",
+    )
 
 
 @router.get("/{meal_id}", status_code=status.HTTP_200_OK, response_model=MealReadSchema)
 async def get_meal(
     meal_id: int,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
-) -> MealReadSchema:
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> Response:
     if current_user.role_id not in (1, 2, 3, 4):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to access this resource.",
         )
-    return await meal_controller.get_meal(meal_id=meal_id)
+    return Response(
+        await meal_controller.get_meal_json(meal_id=meal_id),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/{meal_id}/detail",
+    status_code=status.HTTP_200_OK,
+    response_model=MealDetailSchema,
+)
+async def get_meal_detail(
+    meal_id: int,
+    meal_controller: MealController = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> MealDetailSchema:
+    if current_user.role_id not in (1, 2, 3, 4):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await meal_controller.get_meal_detail(meal_id=meal_id)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=MealReadSchema)
 async def create_meal(
     payload: MealCreateSchema,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> MealReadSchema:
     if current_user.role_id not in (1, 2):
         raise HTTPException(
@@ -70,7 +95,7 @@ async def update_meal(
     meal_id: int,
     payload: MealUpdateSchema,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> MealReadSchema:
     if current_user.role_id not in (1, 2):
         raise HTTPException(
@@ -86,7 +111,7 @@ async def update_meal(
 async def delete_meal(
     meal_id: int,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> None:
     if current_user.role_id not in (1, 2):
         raise HTTPException(
@@ -99,13 +124,13 @@ async def delete_meal(
 @router.get(
     "/{meal_id}/ingredients",
     status_code=status.HTTP_200_OK,
-    response_model=list[IngredientReadSchema],
+    response_model=list[MealIngredientDetailSchema],
 )
 async def get_meal_ingredients(
     meal_id: int,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
-) -> list[IngredientReadSchema]:
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> list[MealIngredientDetailSchema]:
     if current_user.role_id not in (1, 2, 3, 4):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -117,14 +142,14 @@ async def get_meal_ingredients(
 @router.post(
     "/{meal_id}/add-ingredients/",
     status_code=status.HTTP_201_CREATED,
-    response_model=MealReadWithIngredientSchema,
+    response_model=MealDetailSchema,
 )
 async def add_ingredient_to_meal(
     meal_id: int,
     payload: AddIngredientToMealSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     meal_controller: MealController = Depends(),
-) -> MealReadWithIngredientSchema:
+) -> MealDetailSchema:
     if current_user.role_id not in (1, 2, 4):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -143,7 +168,7 @@ async def add_ingredient_to_meal(
 async def remove_ingredient_from_meal(
     meal_id: int,
     ingredient_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     meal_controller: MealController = Depends(),
 ) -> None:
     if current_user.role_id not in (1, 2):
@@ -165,7 +190,7 @@ async def remove_ingredient_from_meal(
 async def serve_meal(
     meal_id: int,
     payload: PortionQty,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     meal_controller: MealController = Depends(),
 ) -> MealReadWithIngredientSchema:
     if current_user.role_id not in (1, 2, 3):
@@ -184,7 +209,7 @@ async def serve_meal(
 async def log_meal(
     meal_id: int,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     payload: MealListQuery = Depends(),
 ) -> MealLogListSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -208,7 +233,7 @@ async def get_meal_log(
     meal_id: int,
     log_id: int,
     meal_controller: MealController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> MealLogReadSchema:
     if current_user.role_id not in (1, 2, 3, 4):
         raise HTTPException(
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 
-from src.models import User
+from src.schemas.users_schemas import PrincipalSchema
 from src.schemas.meal_schemas import MealListQuery
 from src.schemas.portion_calculation_schema import (
     PortionCalculationListSchema,
     PortionCalculationReadSchema,
 )
 from src.services.portion_calculation_controller import PortionCalculationController
-from src.utils.security import get_current_user
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/portion-calculate",
@@ -20,7 +20,7 @@ router = APIRouter(
 )
 async def get_portion_count(
     payload: MealListQuery = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     portion_calculation_controller: PortionCalculationController = Depends(),
 ) -> PortionCalculationListSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -38,7 +38,7 @@ async def get_portion_count(
 )
 async def get_portion_count_by_id(
     meal_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     portion_calculation_controller: PortionCalculationController = Depends(),
 ) -> PortionCalculationReadSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -1,9 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
 
-from src.models import User
-from src.schemas.report_schema import MealLogQueryParams, MealLogPortionStats
-from src.services.meal_controller import MealController
-from src.utils.security import get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+
+from src.database.session import get_standalone_session
+
+from src.schemas.users_schemas import PrincipalSchema
+from src.schemas.report_schema import (
+    MealLogQueryParams,
+    MealLogPortionStats,
+    MonthlyReportReadSchema,
+    PortionByDay,
+    PortionByMonth,
+    PortionByYear,
+    PortionSeriesQuery,
+)
+from src.services import ReportRepository
+from src.services.report_controller import ReportController
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/report",
@@ -14,12 +27,114 @@ router = APIRouter(
 @router.post("/", status_code=status.HTTP_200_OK, response_model=MealLogPortionStats)
 async def get_meal_log_portion_stats(
     payload: MealLogQueryParams,
-    current_user: User = Depends(get_current_user),
-    meal_controller: MealController = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
 ) -> MealLogPortionStats:
     if current_user.role_id not in (1, 2):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to access this resource.",
         )
-    return await meal_controller.get_meal_log_portion_stats(payload=payload)
+    return await report_controller.get_meal_log_portion_stats(payload=payload)
+
+
+@router.get(
+    "/series/daily",
+    status_code=status.HTTP_200_OK,
+    response_model=list[PortionByDay],
+)
+async def get_daily_series(
+    payload: PortionSeriesQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
+) -> list[PortionByDay]:
+    if current_user.role_id not in (1, 2):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await report_controller.get_daily_series(payload=payload)
+
+
+@router.get(
+    "/series/monthly",
+    status_code=status.HTTP_200_OK,
+    response_model=list[PortionByMonth],
+)
+async def get_monthly_series(
+    payload: PortionSeriesQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
+) -> list[PortionByMonth]:
+    if current_user.role_id not in (1, 2):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await report_controller.get_monthly_series(payload=payload)
+
+
+@router.get(
+    "/series/yearly",
+    status_code=status.HTTP_200_OK,
+    response_model=list[PortionByYear],
+)
+async def get_yearly_series(
+    payload: PortionSeriesQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
+) -> list[PortionByYear]:
+    if current_user.role_id not in (1, 2):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await report_controller.get_yearly_series(payload=payload)
+
+
+@router.get(
+    "/monthly",
+    status_code=status.HTTP_200_OK,
+    response_model=list[MonthlyReportReadSchema],
+)
+async def list_monthly_reports(
+    year: int | None = Query(None, ge=1),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
+) -> list[MonthlyReportReadSchema]:
+    if current_user.role_id not in (1, 2):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await report_controller.list_monthly_reports(year)
+
+
+@router.get(
+    "/monthly/{year}/{month}",
+    status_code=status.HTTP_200_OK,
+    response_model=MonthlyReportReadSchema,
+)
+async def get_monthly_report(
+    year: int = Path(..., ge=1),
+    month: int = Path(..., ge=1, le=12),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    report_controller: ReportController = Depends(),
+) -> MonthlyReportReadSchema:
+    if current_user.role_id not in (1, 2):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await report_controller.get_monthly_report(year, month)
+
+
+async def build_monthly_report(year: int | None = None, month: int | None = None):
+    """Stores the report of the given month, the previous one by default."""
+    if year is None or month is None:
+        today = date.today()
+        year, month = (
+            (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
+        )
+    async with get_standalone_session() as session:
+        return await ReportRepository(session).upsert_monthly_report(year, month)
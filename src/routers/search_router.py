@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.schemas.search_schemas import AutocompleteQuery, AutocompleteSchema
+from src.schemas.users_schemas import PrincipalSchema
+from src.services.search_controller import SearchController
+from src.utils.security import get_current_principal
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+)
+
+
+@router.get(
+    "/autocomplete",
+    status_code=status.HTTP_200_OK,
+    response_model=AutocompleteSchema,
+)
+async def autocomplete(
+    params: AutocompleteQuery = Depends(),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+    search_controller: SearchController = Depends(),
+) -> AutocompleteSchema:
+    if current_user.role_id not in (1, 2, 3, 4):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return await search_controller.autocomplete(payload=params)
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 
-from src.models import User
+from src.schemas.users_schemas import PrincipalSchema
 from src.schemas.units_schemas import UnitReadSchema, UnitUpdateSchema, UnitCreateSchema
 from src.services.unit_controller import UnitController
-from src.utils.security import get_current_user
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/units",
@@ -18,7 +18,7 @@ router = APIRouter(
 )
 async def get_all_units(
     unit_controller: UnitController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> list[UnitReadSchema]:
     if current_user.role_id not in (1, 2, 3, 4):
         raise HTTPException(
@@ -35,7 +35,7 @@ async def get_all_units(
 )
 async def get_unit_by_id(
     unit_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     unit_controller: UnitController = Depends(),
 ) -> UnitReadSchema:
     if current_user.role_id not in (1, 2, 3, 4):
@@ -50,7 +50,7 @@ async def get_unit_by_id(
 async def create_unit(
     payload: UnitCreateSchema,
     unit_controller: UnitController = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> UnitReadSchema:
     if current_user.role_id not in (1, 2):
         raise HTTPException(
@@ -66,7 +66,7 @@ async def create_unit(
 async def update_unit(
     unit_id: int,
     payload: UnitUpdateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     unit_controller: UnitController = Depends(),
 ) -> UnitReadSchema:
     if current_user.role_id not in (1, 2, 4):
@@ -80,7 +80,7 @@ async def update_unit(
 @router.delete("/{unit_id}/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_unit(
     unit_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     unit_controller: UnitController = Depends(),
 ) -> None:
     if current_user.role_id not in (
@@ -1,14 +1,14 @@
 from fastapi import Depends, APIRouter, status, HTTPException
 
-from src.models import User
 from src.schemas.users_schemas import (
+    PrincipalSchema,
     UserReadSchema,
     UserListSchema,
     UserListQuery,
     UserUpdateSchema,
 )
 from src.services.user_controller import UserController
-from src.utils.security import get_current_user
+from src.utils.security import get_current_principal
 
 router = APIRouter(
     prefix="/users",
@@ -22,7 +22,7 @@ router = APIRouter(
     response_model=UserReadSchema,
 )
 async def get_user_me(
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     user_controller: UserController = Depends(UserController),
 ) -> UserReadSchema:
     return await user_controller.get_user_by_id(user_id=current_user.id)
@@ -35,7 +35,7 @@ async def get_user_me(
 )
 async def get_user_by_id(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     user_controller: UserController = Depends(UserController),
 ) -> UserReadSchema:
     if current_user.role_id in (1, 2, 3, 4) or current_user.id == user_id:
@@ -53,7 +53,7 @@ async def get_user_by_id(
 )
 async def get_all_users(
     params: UserListQuery = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     user_controller: UserController = Depends(),
 ) -> UserListSchema:
     if current_user.role_id in (1, 2, 3, 4):
@@ -74,7 +74,7 @@ async def get_all_users(
 async def update_user(
     user_id: int,
     payload: UserUpdateSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     user_controller: UserController = Depends(),
 ) -> UserReadSchema:
     if current_user.role_id in (1,) or current_user.id == user_id:
@@ -93,7 +93,7 @@ async def update_user(
 )
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
     user_controller: UserController = Depends(),
 ) -> None:
     if current_user.role_id in (1,) or current_user.id == user_id:
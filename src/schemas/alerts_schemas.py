@@ -32,4 +32,6 @@ class AlertsQuery(QueryList):
 class AlertListSchema(QueryList):
     total: int
     items: list[AlertReadSchema] = Field(default_factory=list)
+    next_cursor: str | None = None
+    total_estimated: bool = False
     model_config = ConfigDict(from_attributes=True)
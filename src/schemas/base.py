@@ -5,5 +5,6 @@ class QueryList(BaseModel):
     search: str | None = None
     page: int = Field(1, ge=1)
     size: int = Field(10, ge=1, le=100)
+    cursor: str | None = Field(None, description="next_cursor of the previous page")
 
     model_config = ConfigDict(from_attributes=True)
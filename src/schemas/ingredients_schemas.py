@@ -41,5 +41,7 @@ class IngredientListSchema(BaseModel):
     items: list[IngredientReadSchema]
 
     search: str | None = None
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class InventoryAsOfQuery(BaseModel):
+    at: datetime = Field(..., description="Point in time to reconstruct")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StockLevelSchema(BaseModel):
+    id: int
+    name: str
+    quantity: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class InventoryAsOfSchema(BaseModel):
+    at: datetime
+    items: list[StockLevelSchema]
+
+    model_config = ConfigDict(from_attributes=True)
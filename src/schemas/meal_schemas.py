@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasPath, BaseModel, Field, ConfigDict
 from datetime import datetime
 
 from src.schemas.ingredients_schemas import IngredientReadSchema
@@ -36,6 +36,7 @@ class MealListQuery(BaseModel):
     search: str | None = None
     page: int = Field(1, ge=1)
     size: int = Field(10, ge=1, le=100)
+    cursor: str | None = Field(None, description="next_cursor of the previous page")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -76,6 +77,27 @@ class MealReadWithIngredientSchema(MealReadSchema):
     ingredients: list[IngredientReadSchema] = Field(default_factory=list)
 
 
+class MealIngredientDetailSchema(BaseModel):
+    """One recipe line, read from a ``MealIngredient`` whose ingredient and
+    its unit are loaded."""
+
+    id: int = Field(validation_alias=AliasPath("ingredient", "id"))
+    name: str = Field(validation_alias=AliasPath("ingredient", "name"))
+    unit_id: int = Field(validation_alias=AliasPath("ingredient", "unit_id"))
+    unit: str = Field(validation_alias=AliasPath("ingredient", "unit", "code"))
+    quantity: float = Field(validation_alias=AliasPath("ingredient", "quantity"))
+    min_threshold: float = Field(
+        validation_alias=AliasPath("ingredient", "min_threshold")
+    )
+    required_qty: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MealDetailSchema(MealReadSchema):
+    ingredients: list[MealIngredientDetailSchema] = Field(default_factory=list)
+
+
 class MealUpdateSchema(BaseModel):
     name: str | None = Field(None, min_length=1, max_length=100)
     picture: str | None = Field(None, max_length=255)
@@ -87,6 +109,8 @@ class MealListSchema(BaseModel):
     size: int
     search: str | None = None
     items: list[MealReadSchema]
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -116,5 +140,7 @@ class MealLogListSchema(BaseModel):
     size: int
     search: str | None = None
     items: list[MealLogReadSchema]
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
     model_config = ConfigDict(from_attributes=True)
@@ -11,5 +11,6 @@ class PortionCalculationReadSchema(BaseModel):
 
 
 class PortionCalculationListSchema(QueryList):
+    total: int
     items: list[PortionCalculationReadSchema]
     model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field
-from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import date, datetime
 
 
 class PortionByDay(BaseModel):
@@ -25,5 +27,25 @@ class MealLogPortionStats(BaseModel):
 
 
 class MealLogQueryParams(BaseModel):
-    year: int = Field(..., ge=1, description="Year to summarize")
+    # The period ends on January 1st of the next year, which must be a date too.
+    year: int = Field(..., ge=1, le=9998, description="Year to summarize")
     month: int = Field(1, ge=1, le=12, description="Month to summarize (optional)")
+
+
+class PortionSeriesQuery(BaseModel):
+    start: date | None = Field(None, description="First day included")
+    end: date | None = Field(None, description="First day excluded")
+    meal_id: int | None = None
+
+
+class MonthlyReportReadSchema(BaseModel):
+    id: int
+    report_year: int
+    report_month: int
+    total_served_portions: int
+    possible_served_portions: int
+    difference_percentage: Decimal
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
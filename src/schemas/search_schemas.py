@@ -0,0 +1,46 @@
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SearchKind(str, Enum):
+    MEAL = "meal"
+    INGREDIENT = "ingredient"
+    USER = "user"
+
+
+class CatalogKind(str, Enum):
+    MEAL = "meal"
+    INGREDIENT = "ingredient"
+
+
+class AutocompleteQuery(BaseModel):
+    q: str = Field(..., min_length=1, max_length=100)
+    kind: SearchKind | None = Field(None, description="Only this kind of match")
+    limit: int = Field(10, ge=1, le=50)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CatalogAutocompleteQuery(BaseModel):
+    q: str = Field(..., min_length=1, max_length=100)
+    kind: CatalogKind | None = Field(None, description="Only this kind of match")
+    limit: int = Field(10, ge=1, le=50)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AutocompleteItemSchema(BaseModel):
+    kind: SearchKind
+    id: int
+    label: str
+    score: float | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AutocompleteSchema(BaseModel):
+    q: str
+    items: list[AutocompleteItemSchema]
+
+    model_config = ConfigDict(from_attributes=True)
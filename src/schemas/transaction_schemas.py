@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.transactions import TransactionType
+
+
+class TransactionListQuery(BaseModel):
+    cursor: str | None = Field(None, description="next_cursor of the previous page")
+    size: int = Field(10, ge=1, le=100)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionReadSchema(BaseModel):
+    id: int
+    ingredient_id: int
+    quantity: float
+    transaction_type: TransactionType
+    reference_id: int | None = None
+    note: str | None = None
+    happened_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionListSchema(BaseModel):
+    size: int
+    items: list[TransactionReadSchema]
+    next_cursor: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
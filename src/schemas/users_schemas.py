@@ -59,6 +59,14 @@ class RefreshTokenSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PrincipalSchema(BaseModel):
+    id: int
+    role_id: int
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserListQuery(QueryList):
     model_config = ConfigDict(from_attributes=True)
 
@@ -69,6 +77,8 @@ class UserListSchema(BaseModel):
     size: int
     search: str | None = None
     items: list[UserReadSchema]
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -5,3 +5,7 @@ from .user_otp_repository import UserOtpRepository
 from .meal_repository import MealRepository
 from .portion_calculation_repository import PortionCalculationRepository
 from .alerts_repository import AlertsRepository
+from .report_repository import ReportRepository
+from .transaction_repository import TransactionRepository
+from .inventory_repository import InventoryRepository
+from .search_repository import SearchRepository
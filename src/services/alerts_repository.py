@@ -1,38 +1,65 @@
+from datetime import datetime
 from typing import Sequence
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import Row, func, literal, text, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.database.session import get_db_session
-from src.models import Alert
+from src.models import Alert, Ingredient, Unit
 from src.schemas.alerts_schemas import AlertsQuery, AlertCreateSchema
+from src.utils.pagination import Page, paginate
+
+
+LOW_STOCK = "LOW_STOCK"
 
 
 class AlertsRepository:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.__session = session
 
-    async def get_alerts(self, payload: AlertsQuery) -> Sequence[Alert]:
-        query = (
-            select(Alert).offset((payload.page - 1) * payload.size).limit(payload.size)
-        )
+    async def get_alerts(self, payload: AlertsQuery) -> Page[Alert]:
+        query = select(Alert)
         if payload.search:
             query = query.where(Alert.ingredient.ilike(f"%{payload.search}%"))
         if payload.is_resolved:
             query = query.filter(Alert.is_resolved == payload.is_resolved)
-        res = await self.__session.execute(query)
-        return res.scalars().all()
+        return await paginate(
+            self.__session,
+            query,
+            [Alert.id],
+            size=payload.size,
+            page=payload.page,
+            cursor=payload.cursor,
+        )
 
     async def get_alert_by_id(self, alert_id: int) -> Alert | None:
         res = await self.__session.execute(select(Alert).where(Alert.id == alert_id))
         return res.scalar_one_or_none()
 
-    async def create_alert(self, payload: AlertCreateSchema) -> Alert:
-        alert = Alert(**payload.model_dump())
-        self.__session.add(alert)
+    async def create_alert(self, payload: AlertCreateSchema) -> Alert | None:
+        """Opens an alert, or returns the open ``LOW_STOCK`` alert of the
+        ingredient when there already is one."""
+        alert = await self.__session.scalar(
+            insert(Alert)
+            .values(**payload.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=[Alert.ingredient_id],
+                index_where=text(f"alert_type = '{LOW_STOCK}' AND NOT is_resolved"),
+            )
+            .returning(Alert)
+        )
+        if alert is None:
+            alert = await self.__session.scalar(
+                select(Alert).where(
+                    Alert.ingredient_id == payload.ingredient_id,
+                    Alert.alert_type == LOW_STOCK,
+                    Alert.is_resolved.is_(False),
+                )
+            )
         await self.__session.commit()
-        await self.__session.refresh(alert)
         return alert
 
     async def delete_alert(self, alert_id: int) -> None:
@@ -57,3 +84,55 @@ class AlertsRepository:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Alert not found.",
         )
+
+    async def sync_low_stock_alerts(self) -> Sequence[Row]:
+        """Resolves alerts of restocked ingredients and opens the new ones.
+
+        Returns ``(id, name, quantity, min_threshold, unit)`` rows for the
+        ingredients that just got an alert, i.e. the ones nobody has been told
+        about yet. At most one unresolved ``LOW_STOCK`` alert exists per
+        ingredient, so concurrent runs never report the same ingredient twice.
+        """
+        await self.__session.execute(
+            update(Alert)
+            .where(
+                Alert.alert_type == LOW_STOCK,
+                Alert.is_resolved.is_(False),
+                Alert.ingredient_id == Ingredient.id,
+                Ingredient.quantity > Ingredient.min_threshold,
+            )
+            .values(is_resolved=True, resolved_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        opened = (
+            insert(Alert)
+            .from_select(
+                ["ingredient_id", "alert_type", "message"],
+                select(
+                    Ingredient.id,
+                    literal(LOW_STOCK),
+                    func.concat(Ingredient.name, " is running low on stock"),
+                ).where(Ingredient.quantity <= Ingredient.min_threshold),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Alert.ingredient_id],
+                index_where=text(f"alert_type = '{LOW_STOCK}' AND NOT is_resolved"),
+            )
+            .returning(Alert.ingredient_id)
+            .cte("opened")
+        )
+        result = await self.__session.execute(
+            select(
+                Ingredient.id,
+                Ingredient.name,
+                Ingredient.quantity,
+                Ingredient.min_threshold,
+                Unit.code.label("unit"),
+            )
+            .join(opened, opened.c.ingredient_id == Ingredient.id)
+            .join(Unit, Unit.id == Ingredient.unit_id)
+            .order_by(Ingredient.name)
+        )
+        rows = result.all()
+        await self.__session.commit()
+        return rows
@@ -1,4 +1,5 @@
 from fastapi import Depends, HTTPException, status
+from src.models import User
 from src.tasks.email import send_verification_email
 
 from src.services.user_otp_service import UserOTPService  # Renamed from controller
@@ -45,19 +46,17 @@ class AuthenticationService:
                 detail="Email already registered.",
             )
 
-    async def _generate_auth_tokens(self, user_data: dict) -> dict:
-
-        payload_data = {
-            k: v
-            for k, v in user_data.items()
-            if k not in ("password", "hashed_password")
-        }
-        return self.__jwt_handler.create_tokens(payload_data)
+    async def _generate_auth_tokens(self, user: User) -> dict:
+        return self.__jwt_handler.create_tokens(
+            {"id": user.id, "email": user.email},
+            role_id=user.role_id,
+            is_active=user.is_active,
+        )
 
     async def register_user(self, payload: UserCreateSchema) -> UserReadSchema:
         await self._validate_user_input(payload)
 
-        hashed_password = self.__security.hash_password(payload.password)
+        hashed_password = await self.__security.hash_password_async(payload.password)
         payload.password = hashed_password
 
         new_user = await self.__user_repository.register_user(payload)
@@ -109,20 +108,25 @@ class AuthenticationService:
                 detail="Incorrect email or password.",
             )
 
-        if not self.__security.verify_password(payload.password, user.password):
+        is_valid, new_hash = await self.__security.verify_and_update_password(
+            payload.password, user.password
+        )
+        if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password.",
             )
+        if new_hash:
+            await self.__user_repository.set_password_hash(user.id, new_hash)
 
         user_dict = UserReadSchema.model_validate(user).model_dump()
-        tokens = await self._generate_auth_tokens(user_dict)
+        tokens = await self._generate_auth_tokens(user)
 
         return UserReadSchemaWithToken(**user_dict, **tokens)
 
     async def refresh_tokens(self, refresh_token: str) -> dict[str, str]:
         try:
-            new_tokens = self.__jwt_handler.refresh_access_token(refresh_token)
+            new_tokens = await self.__jwt_handler.refresh_access_token(refresh_token)
             return new_tokens
         except HTTPException as e:
             raise e
@@ -22,23 +22,25 @@ class IngredientController:
     async def get_all_ingredients(
         self, payload: IngredientListQuery
     ) -> IngredientListSchema:
-        ingredients = await self.__ingredient_repository.get_all_ingredients(
+        page = await self.__ingredient_repository.get_all_ingredients(
             payload=payload,
         )
-        if not ingredients:
+        if not page.items:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="Ingredients are not available yet",
             )
         return IngredientListSchema(
-            total=len(ingredients),
+            total=page.total,
             page=payload.page,
             size=payload.size,
             items=[
                 IngredientReadSchema.model_validate(ingredient)
-                for ingredient in ingredients
+                for ingredient in page.items
             ],
             search=payload.search,
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
         )
 
     async def get_ingredient(self, ingredient_id: int) -> IngredientReadSchema:
@@ -106,12 +108,3 @@ class IngredientController:
         await self.__ingredient_repository.delete_ingredient(
             ingredient_id=ingredient_id,
         )
-
-    async def low_stock_ingredients(self, limit, offset) -> IngredientListSchema:
-        res = await self.__ingredient_repository.low_stock_ingredients(limit, offset)
-        return IngredientListSchema(
-            total=len(res),
-            page=offset,
-            size=limit,
-            items=[IngredientReadSchema.model_validate(r) for r in res],
-        )
@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import Depends
-from typing import Sequence
+from decimal import Decimal
+from typing import Iterable, Sequence
 from fastapi import HTTPException, status
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 
 from src.schemas.ingredients_schemas import (
@@ -13,6 +15,11 @@ from src.schemas.ingredients_schemas import (
 
 from src.database.session import get_db_session
 from src.models import Ingredient
+from src.services.portion_calculation_repository import PortionCalculationRepository
+from src.services.transaction_repository import TransactionRepository
+from src.utils.events import catalog_events, stock_events
+from src.utils.pagination import Page, paginate
+from src.utils.search import fuzzy_match
 
 
 class IngredientRepository:
@@ -27,16 +34,22 @@ class IngredientRepository:
 
     async def get_all_ingredients(
         self, payload: IngredientListQuery
-    ) -> Sequence[Ingredient]:
-        query = (
-            select(Ingredient)
-            .offset((payload.page - 1) * payload.size)
-            .limit(payload.size)
-        )
+    ) -> Page[Ingredient]:
+        query = select(Ingredient)
         if payload.search:
-            query = query.where(Ingredient.name.ilike(f"%{payload.search}%"))
-        result = await self.__session.execute(query)
-        return result.scalars().all()
+            query = query.where(fuzzy_match([Ingredient.name], payload.search))
+        return await paginate(
+            self.__session,
+            query,
+            [Ingredient.id],
+            size=payload.size,
+            page=payload.page,
+            cursor=payload.cursor,
+        )
+
+    async def get_names(self) -> Sequence[Row]:
+        result = await self.__session.execute(select(Ingredient.id, Ingredient.name))
+        return result.all()
 
     async def get_ingredient(self, ingredient_id: int) -> Ingredient | None:
         result = await self.__session.execute(
@@ -44,25 +57,63 @@ class IngredientRepository:
         )
         return result.scalar_one_or_none()
 
+    async def _lock_ingredient(self, ingredient_id: int) -> Ingredient | None:
+        """Reads the ingredient with its row locked until the transaction ends,
+        so a stock change derived from it cannot lose a concurrent serving."""
+        result = await self.__session.execute(
+            select(Ingredient)
+            .where(Ingredient.id == ingredient_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def create_ingredient(
         self, payload: IngredientCreateSchema
     ) -> Ingredient | None:
         ingredient = Ingredient(**payload.model_dump())
         self.__session.add(ingredient)
+        await self.__session.flush()
+        await TransactionRepository(self.__session).record_movements(
+            [(ingredient.id, Decimal(str(payload.quantity)))], note="Initial stock"
+        )
         await self.__session.commit()
         await self.__session.refresh(ingredient)
+        await stock_events.publish({"ingredient_ids": [ingredient.id]})
+        await catalog_events.publish(
+            {"kind": "ingredient", "id": ingredient.id, "name": ingredient.name}
+        )
         return ingredient
 
     async def update_ingredient(
         self, ingredient_id: int, payload: IngredientUpdateSchema
     ) -> Ingredient | None:
-        ingredient = await self.get_ingredient(ingredient_id=ingredient_id)
+        ingredient = await self._lock_ingredient(ingredient_id)
         if ingredient:
+            previous_quantity = ingredient.quantity
             ingredient.update(**payload.model_dump())
             try:
                 self.__session.add(ingredient)
+                await self.__session.flush()
+                if payload.quantity is not None:
+                    await TransactionRepository(self.__session).record_movements(
+                        [
+                            (
+                                ingredient_id,
+                                Decimal(str(payload.quantity)) - previous_quantity,
+                            )
+                        ],
+                        note="Stock adjustment",
+                    )
+                await PortionCalculationRepository(self.__session).refresh(
+                    ingredient_ids=[ingredient_id]
+                )
                 await self.__session.commit()
                 await self.__session.refresh(ingredient)
+                await stock_events.publish({"ingredient_ids": [ingredient_id]})
+                await catalog_events.publish(
+                    {"kind": "ingredient", "id": ingredient_id, "name": ingredient.name}
+                )
                 return ingredient
             except IntegrityError as e:
                 await self.__session.rollback()
@@ -77,9 +128,13 @@ class IngredientRepository:
         if ingredient:
             await self.__session.delete(ingredient)
             await self.__session.commit()
+            await stock_events.publish({"ingredient_ids": [ingredient_id]})
+            await catalog_events.publish(
+                {"kind": "ingredient", "id": ingredient_id, "name": None}
+            )
 
     async def take_stock(self, ingredient_id: int, quantity: float) -> Ingredient:
-        ingredient = await self.get_ingredient(ingredient_id=ingredient_id)
+        ingredient = await self._lock_ingredient(ingredient_id)
         if ingredient is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -87,16 +142,23 @@ class IngredientRepository:
             )
         ingredient.update(quantity=ingredient.quantity - quantity)
         self.__session.add(ingredient)
+        await self.__session.flush()
+        await TransactionRepository(self.__session).record_movements(
+            [(ingredient_id, -Decimal(str(quantity)))], note="Taken from stock"
+        )
+        await PortionCalculationRepository(self.__session).refresh(
+            ingredient_ids=[ingredient_id]
+        )
         await self.__session.commit()
         await self.__session.refresh(ingredient)
+        await stock_events.publish({"ingredient_ids": [ingredient_id]})
         return ingredient
 
-    async def low_stock_ingredients(self, limit, offset) -> Sequence[Ingredient]:
-        query = (
-            select(Ingredient)
-            .offset((offset - 1) * limit)
-            .limit(limit)
-            .where(Ingredient.quantity <= Ingredient.min_threshold)
-        )
+    async def get_stock_snapshot(
+        self, ingredient_ids: Iterable[int] | None = None
+    ) -> Sequence[Ingredient]:
+        query = select(Ingredient).order_by(Ingredient.id)
+        if ingredient_ids is not None:
+            query = query.where(Ingredient.id.in_(ingredient_ids))
         result = await self.__session.execute(query)
         return result.scalars().all()
@@ -0,0 +1,24 @@
+from fastapi import Depends
+
+from src.schemas.inventory_schemas import (
+    InventoryAsOfQuery,
+    InventoryAsOfSchema,
+    StockLevelSchema,
+)
+from src.services import InventoryRepository
+
+
+class InventoryController:
+    def __init__(self, inventory_repository: InventoryRepository = Depends()):
+        self.__inventory_repository = inventory_repository
+
+    async def get_stock_as_of(self, payload: InventoryAsOfQuery) -> InventoryAsOfSchema:
+        # Ledger and snapshot times are naive local timestamps.
+        at = payload.at
+        if at.tzinfo is not None:
+            at = at.astimezone().replace(tzinfo=None)
+        rows = await self.__inventory_repository.get_stock_as_of(at)
+        return InventoryAsOfSchema(
+            at=at,
+            items=[StockLevelSchema.model_validate(row) for row in rows],
+        )
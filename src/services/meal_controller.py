@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, status
-from datetime import datetime
 
+from src.cache.catalog_cache import catalog_cache
 
 from src.schemas.ingredients_schemas import IngredientReadSchema
 from src.schemas.meal_schemas import (
@@ -11,17 +11,12 @@ from src.schemas.meal_schemas import (
     MealUpdateSchema,
     AddIngredientToMealSchema,
     MealReadWithIngredientSchema,
+    MealDetailSchema,
+    MealIngredientDetailSchema,
     PortionQty,
     MealLogListSchema,
     MealLogReadSchema,
 )
-from src.schemas.report_schema import (
-    MealLogQueryParams,
-    MealLogPortionStats,
-    PortionByDay,
-    PortionByMonth,
-    PortionByYear,
-)
 from src.services import MealRepository, IngredientRepository
 
 
@@ -35,20 +30,40 @@ class MealController:
         self.__ingredient_repository = ingredient_repository
 
     async def list_meals(self, payload: MealListQuery) -> MealListSchema:
-        meals = await self.__meal_repository.list_meals(payload=payload)
-        if not meals:
+        page = await self.__meal_repository.list_meals(payload=payload)
+        if not page.items:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="There is no meal available yet.",
             )
         return MealListSchema(
-            items=[MealReadSchema.model_validate(meal) for meal in meals],
-            total=len(meals),
+            items=[MealReadSchema.model_validate(meal) for meal in page.items],
+            total=page.total,
             page=payload.page,
             size=payload.size,
             search=payload.search,
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
+        )
+
+    async def list_meals_json(self, payload: MealListQuery) -> bytes:
+        """``list_meals`` serialized, served from the catalog cache."""
+
+        async def load() -> bytes:
+            return (await self.list_meals(payload)).model_dump_json().encode()
+
+        return await catalog_cache.get_or_load(
+            f"meals:{payload.model_dump_json()}", load
         )
 
+    async def get_meal_json(self, meal_id: int) -> bytes:
+        """``get_meal`` serialized, served from the catalog cache."""
+
+        async def load() -> bytes:
+            return (await self.get_meal(meal_id)).model_dump_json().encode()
+
+        return await catalog_cache.get_or_load(f"meal:{meal_id}", load)
+
     async def get_meal(self, meal_id: int) -> MealReadSchema:
         meal = await self.__meal_repository.get_meal(meal_id=meal_id)
         if not meal:
@@ -58,6 +73,15 @@ class MealController:
             )
         return MealReadSchema.model_validate(meal)
 
+    async def get_meal_detail(self, meal_id: int) -> MealDetailSchema:
+        meal = await self.__meal_repository.get_meal_detail(meal_id=meal_id)
+        if not meal:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meal not found.",
+            )
+        return MealDetailSchema.model_validate(meal)
+
     async def create_meal(self, payload: MealCreateSchema) -> MealReadSchema:
         meal = await self.__meal_repository.create_meal(payload=payload)
         return MealReadSchema.model_validate(meal)
@@ -78,25 +102,23 @@ class MealController:
     async def delete_meal(self, meal_id: int) -> None:
         await self.__meal_repository.delete_meal(meal_id=meal_id)
 
-    async def get_meal_ingredients(self, meal_id: int) -> list[IngredientReadSchema]:
-        meal_ingredients = await self.__meal_repository.get_meal_ingredients(meal_id)
-        if not meal_ingredients:
+    async def get_meal_ingredients(
+        self, meal_id: int
+    ) -> list[MealIngredientDetailSchema]:
+        meal = await self.__meal_repository.get_meal_detail(meal_id)
+        if meal is None or not meal.ingredients:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="There is no ingredient available yet for this meal.",
             )
         return [
-            IngredientReadSchema.model_validate(
-                await self.__ingredient_repository.get_ingredient(
-                    meal_ingredient.ingredient_id
-                )
-            )
-            for meal_ingredient in meal_ingredients
+            MealIngredientDetailSchema.model_validate(meal_ingredient)
+            for meal_ingredient in meal.ingredients
         ]
 
     async def add_ingredient_to_meal(
         self, meal_id: int, payload: AddIngredientToMealSchema
-    ) -> MealReadWithIngredientSchema:
+    ) -> MealDetailSchema:
         ingredient = await self.__ingredient_repository.get_ingredient(
             payload.ingredient_id
         )
@@ -115,18 +137,8 @@ class MealController:
             meal_id=meal_id, payload=payload
         )
 
-        meal_ings = await self.__meal_repository.get_meal_ingredients(meal_id)
-        return MealReadWithIngredientSchema(
-            **meal.to_dict(),
-            ingredients=[
-                IngredientReadSchema.model_validate(
-                    await self.__ingredient_repository.get_ingredient(
-                        meal_ing.ingredient_id
-                    )
-                )
-                for meal_ing in meal_ings
-            ],
-        )
+        meal = await self.__meal_repository.get_meal_detail(meal_id)
+        return MealDetailSchema.model_validate(meal)
 
     async def remove_ingredient_from_meal(
         self, meal_id: int, ingredient_id: int
@@ -138,48 +150,18 @@ class MealController:
     async def serve_meal(
         self, user_id: int, meal_id: int, payload: PortionQty
     ) -> MealReadWithIngredientSchema:
-        meal = await self.__meal_repository.get_meal(meal_id)
-        if not meal:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Meal not found.",
-            )
-        meal_ingredients = await self.__meal_repository.get_meal_ingredients(meal_id)
-        if not meal_ingredients:
-            raise HTTPException(
-                status_code=status.HTTP_200_OK,
-                detail="There is no ingredient available yet for this meal.",
-            )
-
-        for meal_ingredient in meal_ingredients:
-            required_amount = payload.portion_qty * meal_ingredient.required_qty
-            ingredient = await self.__ingredient_repository.get_ingredient(
-                meal_ingredient.ingredient_id
-            )
-            if required_amount > ingredient.quantity:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Not enough {ingredient.name} in stock.",
-                )
-        for meal_ingredient in meal_ingredients:
-            required_amount = payload.portion_qty * meal_ingredient.required_qty
-            await self.__ingredient_repository.take_stock(
-                meal_ingredient.ingredient_id, required_amount
-            )
-
-        await self.__meal_repository.write_meal_logs(
-            meal_id=meal_id, user_id=user_id, portion_qty=payload.portion_qty
+        meal = MealReadSchema.model_validate_json(await self.get_meal_json(meal_id))
+        ingredients = await self.__meal_repository.serve_meal(
+            meal_id=meal_id,
+            user_id=user_id,
+            portion_qty=payload.portion_qty,
         )
 
         return MealReadWithIngredientSchema(
-            **meal.to_dict(),
+            **meal.model_dump(),
             ingredients=[
-                IngredientReadSchema.model_validate(
-                    await self.__ingredient_repository.get_ingredient(
-                        meal_ingredient.ingredient_id
-                    )
-                )
-                for meal_ingredient in meal_ingredients
+                IngredientReadSchema.model_validate(ingredient)
+                for ingredient in ingredients
             ],
         )
 
@@ -191,19 +173,21 @@ class MealController:
                 detail="Meal not found.",
             )
 
-        meal_logs = await self.__meal_repository.log_meal(
+        page = await self.__meal_repository.log_meal(
             meal_id=meal_id,
             payload=payload,
         )
 
         return MealLogListSchema(
-            total=len(meal_logs),
+            total=page.total,
             page=payload.page,
             size=payload.size,
             search=payload.search,
             items=[
-                MealLogReadSchema.model_validate(meal_log) for meal_log in meal_logs
+                MealLogReadSchema.model_validate(meal_log) for meal_log in page.items
             ],
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
         )
 
     async def get_meal_log(self, meal_id: int, log_id: int) -> MealLogReadSchema:
@@ -222,34 +206,3 @@ class MealController:
             )
 
         return MealLogReadSchema.model_validate(log)
-
-    async def get_meal_log_portion_stats(
-        self, payload: MealLogQueryParams
-    ) -> MealLogPortionStats:
-
-        day_portion_count, month_portion_count, year_portion_count = (
-            await self.__meal_repository.get_meal_portion_by_time(
-                payload.year, payload.month
-            )
-        )
-        return MealLogPortionStats(
-            daily=[
-                PortionByDay(
-                    date=datetime.now(),
-                    total_portions=day_portion_count,
-                )
-            ],
-            monthly=[
-                PortionByMonth(
-                    month=payload.month,
-                    year=payload.year,
-                    total_portions=month_portion_count,
-                )
-            ],
-            yearly=[
-                PortionByYear(
-                    year=payload.year,
-                    total_portions=year_portion_count,
-                )
-            ],
-        )
@@ -1,12 +1,21 @@
-from typing import Sequence, Tuple, Optional
+from typing import Sequence
 
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, extract, cast, Date
+from sqlalchemy.orm import selectinload
+from sqlalchemy import Row, update
 
+from src.cache.catalog_cache import catalog_cache
+from src.config.settings import Settings, get_settings
 from src.database.session import get_db_session
-from src.models import Meal, MealIngredient, MealLog
+from src.models import Meal, MealIngredient, MealLog, Ingredient
+from src.services.portion_calculation_repository import PortionCalculationRepository
+from src.services.report_repository import ReportRepository
+from src.services.transaction_repository import TransactionRepository
+from src.utils.events import catalog_events, stock_events
+from src.utils.pagination import Page, paginate
+from src.utils.search import fuzzy_match
 from src.schemas.meal_schemas import (
     MealListQuery,
     MealCreateSchema,
@@ -14,6 +23,8 @@ from src.schemas.meal_schemas import (
     AddIngredientToMealSchema,
 )
 
+settings: Settings = get_settings()
+
 
 class MealRepository:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
@@ -24,20 +35,47 @@ class MealRepository:
         result = await self.__session.execute(query)
         return result.scalar_one_or_none()
 
-    async def list_meals(self, payload: MealListQuery) -> Sequence[Meal]:
-        query = (
-            select(Meal).offset((payload.page - 1) * payload.size).limit(payload.size)
-        )
+    async def list_meals(self, payload: MealListQuery) -> Page[Meal]:
+        query = select(Meal)
         if payload.search:
-            query = query.where(Meal.name.ilike(f"%{payload.search}%"))
-        result = await self.__session.execute(query)
-        return result.scalars().all()
+            query = query.where(fuzzy_match([Meal.name], payload.search))
+        return await paginate(
+            self.__session,
+            query,
+            [Meal.id],
+            size=payload.size,
+            page=payload.page,
+            cursor=payload.cursor,
+        )
+
+    async def get_names(self) -> Sequence[Row]:
+        result = await self.__session.execute(select(Meal.id, Meal.name))
+        return result.all()
 
     async def get_meal(self, meal_id: int) -> Meal | None:
         query = select(Meal).where(Meal.id == meal_id)
         result = await self.__session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_meal_detail(self, meal_id: int) -> Meal | None:
+        """The meal with its recipe lines, their ingredients and units.
+
+        Two queries whatever the recipe size: the meal, then its lines joined
+        to ingredients and units.
+        """
+        query = (
+            select(Meal)
+            .where(Meal.id == meal_id)
+            .options(
+                selectinload(Meal.ingredients)
+                .joinedload(MealIngredient.ingredient)
+                .joinedload(Ingredient.unit)
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.__session.execute(query)
+        return result.scalar_one_or_none()
+
     async def create_meal(self, payload: MealCreateSchema) -> Meal:
         existing_meal = await self.get_meal_by_name(name=payload.name)
         if existing_meal:
@@ -49,6 +87,8 @@ class MealRepository:
         self.__session.add(meal)
         await self.__session.commit()
         await self.__session.refresh(meal)
+        await catalog_cache.invalidate()
+        await catalog_events.publish({"kind": "meal", "id": meal.id, "name": meal.name})
         return meal
 
     async def update_meal(self, meal_id: int, payload: MealUpdateSchema) -> Meal:
@@ -67,6 +107,8 @@ class MealRepository:
         meal.update(**payload.model_dump())
         await self.__session.commit()
         await self.__session.refresh(meal)
+        await catalog_cache.invalidate()
+        await catalog_events.publish({"kind": "meal", "id": meal.id, "name": meal.name})
         return meal
 
     async def delete_meal(self, meal_id: int) -> None:
@@ -81,6 +123,8 @@ class MealRepository:
             await self.__session.delete(ingredient)
         await self.__session.delete(meal)
         await self.__session.commit()
+        await catalog_cache.invalidate()
+        await catalog_events.publish({"kind": "meal", "id": meal_id, "name": None})
 
     async def get_meal_ingredient_by_id(
         self, meal_id: int, ingredient_id: int
@@ -114,8 +158,12 @@ class MealRepository:
             required_qty=payload.required_qty,
         )
         self.__session.add(meal_ingredient)
+        await self.__session.flush()
+        await PortionCalculationRepository(self.__session).refresh(meal_ids=[meal_id])
         await self.__session.commit()
         await self.__session.refresh(meal_ingredient)
+        await catalog_cache.invalidate()
+        await catalog_events.publish({"kind": "recipe", "id": meal_id})
         return meal_ingredient
 
     async def remove_ingredient_from_meal(self, meal_id: int, ingredient_id: int):
@@ -128,64 +176,148 @@ class MealRepository:
                 detail="Meal ingredient not found.",
             )
         await self.__session.delete(meal_ingredient)
+        await self.__session.flush()
+        await PortionCalculationRepository(self.__session).refresh(meal_ids=[meal_id])
         await self.__session.commit()
+        await catalog_cache.invalidate()
+        await catalog_events.publish({"kind": "recipe", "id": meal_id})
 
     async def write_meal_logs(
         self, /, *, meal_id: int, user_id: int, portion_qty: int
     ) -> None:
-        meal_log = MealLog(meal_id=meal_id, user_id=user_id, portion_qty=portion_qty)
-        self.__session.add(meal_log)
+        await self._add_meal_log(
+            meal_id=meal_id, user_id=user_id, portion_qty=portion_qty
+        )
         await self.__session.commit()
-        await self.__session.refresh(meal_log)
 
-    async def log_meal(self, meal_id: int, payload: MealListQuery) -> Sequence[MealLog]:
-        query = (
-            select(MealLog)
-            .where(MealLog.meal_id == meal_id)
-            .offset((payload.page - 1) * payload.size)
-            .limit(payload.size)
+    async def _add_meal_log(
+        self, /, *, meal_id: int, user_id: int, portion_qty: int
+    ) -> MealLog:
+        """Adds the log and counts it in the daily rollup; does not commit."""
+        meal_log = MealLog(meal_id=meal_id, user_id=user_id, portion_qty=portion_qty)
+        self.__session.add(meal_log)
+        await ReportRepository(self.__session).add_to_daily_rollup(
+            meal_id=meal_id, portion_qty=portion_qty
         )
-        if payload.search:
-            query = query.where(MealLog.user_id.ilike(f"%{payload.search}%"))
-        result = await self.__session.execute(query)
-        return result.scalars().all()
+        return meal_log
 
-    async def get_log(self, meal_id: int, log_id) -> MealLog | None:
-        query = select(MealLog).where(MealLog.meal_id == meal_id, MealLog.id == log_id)
-        result = await self.__session.execute(query)
-        return result.scalar_one_or_none()
+    async def serve_meal(
+        self,
+        /,
+        *,
+        meal_id: int,
+        user_id: int,
+        portion_qty: int,
+    ) -> Sequence[Ingredient]:
+        """Decrements every ingredient of the meal and writes the log in one commit.
 
-    async def get_meal_portion_by_time(
-        self, year: int, month: Optional[int] = None
-    ) -> Tuple[int, Optional[int], int]:
-        stmt_year = select(func.coalesce(func.sum(MealLog.portion_qty), 0)).where(
-            extract("year", MealLog.served_at) == year
-        )
-        total_for_year = (await self.__session.execute(stmt_year)).scalar_one()
+        The ledger gets one ``OUT`` row per ingredient, referencing the meal
+        log, in the same transaction. The recipe is read inside the
+        transaction too, so a cached copy of the meal can never be served from.
 
-        total_for_month: Optional[int] = None
-        if month is not None:
-            stmt_month = select(func.coalesce(func.sum(MealLog.portion_qty), 0)).where(
-                extract("year", MealLog.served_at) == year,
-                extract("month", MealLog.served_at) == month,
-            )
-            total_for_month = (await self.__session.execute(stmt_month)).scalar_one()
+        The stock check and the decrement are the same conditional UPDATE, so
+        the whole serving is all-or-nothing: if any ingredient is short the
+        transaction is rolled back and nothing is taken from stock.
 
-        stmt_max_date = select(func.max(MealLog.served_at)).where(
-            extract("year", MealLog.served_at) == year
+        With ``SERVE_ROW_LOCKING`` enabled the ingredient rows are locked in id
+        order first, so concurrent servings of meals sharing ingredients queue
+        up behind each other instead of deadlocking.
+        """
+        recipe_query = (
+            select(MealIngredient.ingredient_id)
+            .join(Ingredient, Ingredient.id == MealIngredient.ingredient_id)
+            .where(MealIngredient.meal_id == meal_id)
+            .order_by(Ingredient.id)
         )
-        if month is not None:
-            stmt_max_date = stmt_max_date.where(
-                extract("month", MealLog.served_at) == month
+        if settings.SERVE_ROW_LOCKING:
+            recipe_query = recipe_query.with_for_update(of=Ingredient)
+        recipe = (await self.__session.scalars(recipe_query)).all()
+        if not recipe:
+            await self.__session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_200_OK,
+                detail="There is no ingredient available yet for this meal.",
+            )
+
+        stmt = (
+            update(Ingredient)
+            .where(
+                Ingredient.id == MealIngredient.ingredient_id,
+                MealIngredient.meal_id == meal_id,
+                Ingredient.quantity >= MealIngredient.required_qty * portion_qty,
             )
-        last_dt = (await self.__session.execute(stmt_max_date)).scalar_one_or_none()
+            .values(
+                quantity=Ingredient.quantity - MealIngredient.required_qty * portion_qty
+            )
+            .returning(Ingredient, MealIngredient.required_qty)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.__session.execute(stmt)
+        rows = result.all()
+        ingredients = [ingredient for ingredient, _ in rows]
 
-        total_for_last_day = 0
-        if last_dt is not None:
-            last_date = last_dt.date()
-            stmt_day = select(func.coalesce(func.sum(MealLog.portion_qty), 0)).where(
-                cast(MealLog.served_at, Date) == last_date
+        if len(ingredients) != len(recipe):
+            await self.__session.rollback()
+            served = {ingredient.id for ingredient in ingredients}
+            short_id = next(
+                (
+                    ingredient_id
+                    for ingredient_id in recipe
+                    if ingredient_id not in served
+                ),
+                None,
+            )
+            if short_id is None:
+                # A recipe edit committed between the two statements, with or
+                # without row locking: only ingredient rows are locked, and a
+                # lock could not hold back a newly added recipe line anyway.
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="The meal recipe just changed, please retry.",
+                )
+            short_name = await self.__session.scalar(
+                select(Ingredient.name).where(Ingredient.id == short_id)
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Not enough {short_name} in stock.",
             )
-            total_for_last_day = (await self.__session.execute(stmt_day)).scalar_one()
 
-        return total_for_year, total_for_month, total_for_last_day
+        meal_log = await self._add_meal_log(
+            meal_id=meal_id, user_id=user_id, portion_qty=portion_qty
+        )
+        await self.__session.flush()
+        await TransactionRepository(self.__session).record_movements(
+            [
+                (ingredient.id, -required_qty * portion_qty)
+                for ingredient, required_qty in rows
+            ],
+            reference_id=meal_log.id,
+            note="Meal served",
+        )
+        await PortionCalculationRepository(self.__session).refresh(
+            ingredient_ids=[ingredient.id for ingredient in ingredients]
+        )
+        await self.__session.commit()
+        await stock_events.publish(
+            {"ingredient_ids": [ingredient.id for ingredient in ingredients]}
+        )
+        return sorted(ingredients, key=lambda ingredient: ingredient.id)
+
+    async def log_meal(self, meal_id: int, payload: MealListQuery) -> Page[MealLog]:
+        query = select(MealLog).where(MealLog.meal_id == meal_id)
+        if payload.search:
+            query = query.where(MealLog.user_id.ilike(f"%{payload.search}%"))
+        return await paginate(
+            self.__session,
+            query,
+            [MealLog.served_at, MealLog.id],
+            size=payload.size,
+            page=payload.page,
+            cursor=payload.cursor,
+        )
+
+    async def get_log(self, meal_id: int, log_id) -> MealLog | None:
+        query = select(MealLog).where(MealLog.meal_id == meal_id, MealLog.id == log_id)
+        result = await self.__session.execute(query)
+        return result.scalar_one_or_none()
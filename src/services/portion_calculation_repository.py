@@ -1,2 +1,106 @@
+from typing import Iterable, Sequence
+
+from fastapi import Depends
+from sqlalchemy import Row, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.database.session import get_db_session
+from src.models import Ingredient, Meal, MealIngredient, MealPortion
+from src.schemas.meal_schemas import MealListQuery
+
+
 class PortionCalculationRepository:
-    pass
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.__session = session
+
+    @staticmethod
+    def _portions_query():
+        # floor(min(quantity / required_qty)) per meal; meals without
+        # ingredients get NULL from the outer join and count as 0 portions.
+        portion_count = func.coalesce(
+            func.greatest(
+                func.floor(func.min(Ingredient.quantity / MealIngredient.required_qty)),
+                0,
+            ),
+            0,
+        ).label("portion_count")
+        return (
+            select(Meal.id, portion_count)
+            .outerjoin(MealIngredient, MealIngredient.meal_id == Meal.id)
+            .outerjoin(Ingredient, Ingredient.id == MealIngredient.ingredient_id)
+            .group_by(Meal.id)
+        )
+
+    @staticmethod
+    def _cached_query():
+        # Meals that were never refreshed have no ingredients yet, hence 0.
+        return select(
+            Meal, func.coalesce(MealPortion.portion_count, 0).label("portion_count")
+        ).outerjoin(MealPortion, MealPortion.meal_id == Meal.id)
+
+    async def get_portion_counts(
+        self, payload: MealListQuery
+    ) -> Sequence[Row[tuple[Meal, int, int]]]:
+        """One page of ``(meal, portion_count, total)`` rows, ``total``
+        counting every matching meal."""
+        query = (
+            self._cached_query()
+            .add_columns(func.count().over().label("total"))
+            .order_by(Meal.id)
+            .offset((payload.page - 1) * payload.size)
+            .limit(payload.size)
+        )
+        if payload.search:
+            query = query.where(Meal.name.ilike(f"%{payload.search}%"))
+        result = await self.__session.execute(query)
+        return result.all()
+
+    async def get_portion_count(self, meal_id: int) -> Row[tuple[Meal, int]] | None:
+        result = await self.__session.execute(
+            self._cached_query().where(Meal.id == meal_id)
+        )
+        return result.one_or_none()
+
+    async def refresh(
+        self,
+        *,
+        meal_ids: Iterable[int] = (),
+        ingredient_ids: Iterable[int] = (),
+    ) -> None:
+        """Recomputes the cached portions of the given meals and of every meal
+        using one of the given ingredients.
+
+        Runs inside the caller's transaction and does not commit. The cached
+        rows are locked in meal order before recomputing so that concurrent
+        stock changes on the same meal cannot overwrite each other with a
+        stale value.
+        """
+        meal_ids, ingredient_ids = list(meal_ids), list(ingredient_ids)
+        if not meal_ids and not ingredient_ids:
+            return
+        affected = Meal.id.in_(meal_ids) | Meal.id.in_(
+            select(MealIngredient.meal_id).where(
+                MealIngredient.ingredient_id.in_(ingredient_ids)
+            )
+        )
+
+        await self.__session.execute(
+            select(MealPortion.id)
+            .where(MealPortion.meal_id.in_(select(Meal.id).where(affected)))
+            .order_by(MealPortion.meal_id)
+            .with_for_update()
+        )
+        stmt = insert(MealPortion).from_select(
+            ["meal_id", "portion_count"], self._portions_query().where(affected)
+        )
+        await self.__session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MealPortion.meal_id],
+                set_={
+                    "portion_count": stmt.excluded.portion_count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
@@ -0,0 +1,101 @@
+from calendar import monthrange
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from fastapi import Depends, HTTPException, status
+
+from src.schemas.report_schema import (
+    MealLogQueryParams,
+    MealLogPortionStats,
+    MonthlyReportReadSchema,
+    PortionByDay,
+    PortionByMonth,
+    PortionByYear,
+    PortionSeriesQuery,
+)
+from src.services import ReportRepository
+
+
+class ReportController:
+    def __init__(self, report_repository: ReportRepository = Depends()):
+        self.__report_repository = report_repository
+
+    async def get_meal_log_portion_stats(
+        self, payload: MealLogQueryParams
+    ) -> MealLogPortionStats:
+        # One grouped pass over the year's rollup rows; months and the year
+        # are folded from the daily totals.
+        daily_rows = await self.__report_repository.get_portion_series(
+            "day", date(payload.year, 1, 1), date(payload.year + 1, 1, 1)
+        )
+        by_day = {day.date(): int(total) for day, total in daily_rows}
+        by_month: dict[int, int] = defaultdict(int)
+        for day, total in by_day.items():
+            by_month[day.month] += total
+
+        first_day = datetime(payload.year, payload.month, 1)
+        days_in_month = monthrange(payload.year, payload.month)[1]
+        return MealLogPortionStats(
+            daily=[
+                PortionByDay(
+                    date=first_day + timedelta(days=offset),
+                    total_portions=by_day.get(
+                        (first_day + timedelta(days=offset)).date(), 0
+                    ),
+                )
+                for offset in range(days_in_month)
+            ],
+            monthly=[
+                PortionByMonth(
+                    year=payload.year, month=month, total_portions=by_month[month]
+                )
+                for month in range(1, 13)
+            ],
+            yearly=[
+                PortionByYear(year=payload.year, total_portions=sum(by_day.values()))
+            ],
+        )
+
+    async def get_daily_series(self, payload: PortionSeriesQuery) -> list[PortionByDay]:
+        rows = await self.__report_repository.get_portion_series(
+            "day", payload.start, payload.end, payload.meal_id
+        )
+        return [PortionByDay(date=day, total_portions=total) for day, total in rows]
+
+    async def get_monthly_series(
+        self, payload: PortionSeriesQuery
+    ) -> list[PortionByMonth]:
+        rows = await self.__report_repository.get_portion_series(
+            "month", payload.start, payload.end, payload.meal_id
+        )
+        return [
+            PortionByMonth(year=month.year, month=month.month, total_portions=total)
+            for month, total in rows
+        ]
+
+    async def get_yearly_series(
+        self, payload: PortionSeriesQuery
+    ) -> list[PortionByYear]:
+        rows = await self.__report_repository.get_portion_series(
+            "year", payload.start, payload.end, payload.meal_id
+        )
+        return [
+            PortionByYear(year=year.year, total_portions=total) for year, total in rows
+        ]
+
+    async def get_monthly_report(
+        self, year: int, month: int
+    ) -> MonthlyReportReadSchema:
+        report = await self.__report_repository.get_monthly_report(year, month)
+        if report is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found.",
+            )
+        return MonthlyReportReadSchema.model_validate(report)
+
+    async def list_monthly_reports(
+        self, year: int | None = None
+    ) -> list[MonthlyReportReadSchema]:
+        reports = await self.__report_repository.list_monthly_reports(year)
+        return [MonthlyReportReadSchema.model_validate(report) for report in reports]
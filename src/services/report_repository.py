@@ -0,0 +1,216 @@
+from datetime import date, datetime, time, timedelta
+from decimal import ROUND_FLOOR, Decimal
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy import Date, DateTime, Row, cast, delete, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.database.session import get_db_session
+from src.models import MealIngredient, MealLog, MealLogDaily, Report
+from src.services.inventory_repository import InventoryRepository
+
+
+def remaining_portions(
+    stock: dict[int, Decimal],
+    recipes: dict[int, dict[int, Decimal]],
+    served_by_meal: dict[int, int],
+) -> int:
+    """Portions ``stock`` still allows, cooked in the month's serving mix.
+
+    Meals share ingredients, so per-meal capacities cannot be added up: every
+    unit of stock would be counted once per meal using it. Instead the mix of
+    meals served in the month (every meal with a recipe equally when nothing
+    was served) gives the average need of each ingredient per portion, and the
+    stock is divided by that, each ingredient counted once. Ingredients
+    missing from ``stock`` count as out of stock.
+    """
+    weights = {meal_id: served_by_meal.get(meal_id, 0) for meal_id in recipes}
+    if not any(weights.values()):
+        weights = {meal_id: 1 for meal_id, recipe in recipes.items() if recipe}
+    total_weight = sum(weights.values())
+    if not total_weight:
+        return 0
+
+    need: dict[int, Decimal] = {}
+    for meal_id, weight in weights.items():
+        for ingredient_id, required_qty in recipes[meal_id].items():
+            need[ingredient_id] = need.get(ingredient_id, 0) + weight * required_qty
+    portions = [
+        max(stock.get(ingredient_id, Decimal(0)), Decimal(0))
+        * total_weight
+        / total_need
+        for ingredient_id, total_need in need.items()
+        if total_need > 0
+    ]
+    if not portions:
+        return 0
+    return int(min(portions).to_integral_value(rounding=ROUND_FLOOR))
+
+
+class ReportRepository:
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.__session = session
+
+    async def add_to_daily_rollup(self, meal_id: int, portion_qty: int) -> None:
+        """Counts a serving of today in ``meal_log_daily``; does not commit."""
+        stmt = insert(MealLogDaily).values(
+            served_on=func.current_date(),
+            meal_id=meal_id,
+            total_portions=portion_qty,
+            servings=1,
+        )
+        await self.__session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MealLogDaily.served_on, MealLogDaily.meal_id],
+                set_={
+                    "total_portions": MealLogDaily.total_portions + portion_qty,
+                    "servings": MealLogDaily.servings + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def rebuild_daily_rollup(self) -> int:
+        """Recomputes ``meal_log_daily`` from ``meal_logs``.
+
+        New servings are blocked until the rebuild commits, so none of them
+        is counted twice or lost.
+        """
+        await self.__session.execute(text("LOCK TABLE meal_logs IN SHARE MODE"))
+        await self.__session.execute(delete(MealLogDaily))
+        served_on = cast(MealLog.served_at, Date)
+        result = await self.__session.execute(
+            insert(MealLogDaily).from_select(
+                ["served_on", "meal_id", "total_portions", "servings"],
+                select(
+                    served_on,
+                    MealLog.meal_id,
+                    func.sum(MealLog.portion_qty),
+                    func.count(),
+                ).group_by(served_on, MealLog.meal_id),
+            )
+        )
+        await self.__session.commit()
+        return result.rowcount
+
+    async def get_portion_series(
+        self,
+        granularity: str,
+        start: date | None = None,
+        end: date | None = None,
+        meal_id: int | None = None,
+    ) -> Sequence[Row[tuple[datetime, int]]]:
+        """Served portions per ``day``, ``month`` or ``year`` for
+        ``start <= served_on < end``, read from the daily rollup.
+        """
+        period = func.date_trunc(
+            granularity, cast(MealLogDaily.served_on, DateTime)
+        ).label("period")
+        query = (
+            select(period, func.sum(MealLogDaily.total_portions).label("total"))
+            .group_by(period)
+            .order_by(period)
+        )
+        if start is not None:
+            query = query.where(MealLogDaily.served_on >= start)
+        if end is not None:
+            query = query.where(MealLogDaily.served_on < end)
+        if meal_id is not None:
+            query = query.where(MealLogDaily.meal_id == meal_id)
+        result = await self.__session.execute(query)
+        return result.all()
+
+    async def _served_by_meal(self, start: date, end: date) -> dict[int, int]:
+        result = await self.__session.execute(
+            select(MealLogDaily.meal_id, func.sum(MealLogDaily.total_portions))
+            .where(MealLogDaily.served_on >= start, MealLogDaily.served_on < end)
+            .group_by(MealLogDaily.meal_id)
+        )
+        return {meal_id: int(total) for meal_id, total in result.all()}
+
+    async def _recipes(self) -> dict[int, dict[int, Decimal]]:
+        result = await self.__session.execute(
+            select(
+                MealIngredient.meal_id,
+                MealIngredient.ingredient_id,
+                MealIngredient.required_qty,
+            )
+        )
+        recipes: dict[int, dict[int, Decimal]] = {}
+        for meal_id, ingredient_id, required_qty in result.all():
+            recipes.setdefault(meal_id, {})[ingredient_id] = Decimal(required_qty)
+        return recipes
+
+    async def _store(
+        self, year: int, month: int, served: int, possible: int, difference: Decimal
+    ) -> Report:
+        stmt = insert(Report).values(
+            report_year=year,
+            report_month=month,
+            total_served_portions=served,
+            possible_served_portions=possible,
+            difference_percentage=difference,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Report.report_year, Report.report_month],
+            set_={
+                "total_served_portions": stmt.excluded.total_served_portions,
+                "possible_served_portions": stmt.excluded.possible_served_portions,
+                "difference_percentage": stmt.excluded.difference_percentage,
+                "updated_at": func.now(),
+            },
+        ).returning(Report)
+        result = await self.__session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        report = result.scalar_one()
+        await self.__session.commit()
+        return report
+
+    async def upsert_monthly_report(self, year: int, month: int) -> Report:
+        """Computes the month's figures and stores them.
+
+        ``possible_served_portions`` is what was served plus what the stock
+        left at the end of the month still allows (see ``remaining_portions``).
+        The stock is reconstructed from snapshots and the ledger, so a month
+        can be rebuilt at any later time with the same result; recipes are
+        the current ones, there is no recipe history. Re-running it for the
+        same month overwrites the row.
+        """
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1)
+        served_by_meal = await self._served_by_meal(start, end)
+        stock_rows = await InventoryRepository(self.__session).get_stock_as_of(
+            datetime.combine(end, time.min) - timedelta(microseconds=1)
+        )
+        remaining = remaining_portions(
+            {row.id: Decimal(row.quantity) for row in stock_rows},
+            await self._recipes(),
+            served_by_meal,
+        )
+        served = sum(served_by_meal.values())
+        possible = served + remaining
+        difference = (
+            (Decimal(remaining * 100) / possible).quantize(Decimal("0.01"))
+            if possible
+            else Decimal(0)
+        )
+        return await self._store(year, month, served, possible, difference)
+
+    async def get_monthly_report(self, year: int, month: int) -> Report | None:
+        result = await self.__session.execute(
+            select(Report).where(
+                Report.report_year == year, Report.report_month == month
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_monthly_reports(self, year: int | None = None) -> Sequence[Report]:
+        query = select(Report).order_by(Report.report_year, Report.report_month)
+        if year is not None:
+            query = query.where(Report.report_year == year)
+        result = await self.__session.execute(query)
+        return result.scalars().all()
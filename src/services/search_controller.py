@@ -0,0 +1,27 @@
+from fastapi import Depends
+
+from src.schemas.search_schemas import (
+    AutocompleteItemSchema,
+    AutocompleteQuery,
+    AutocompleteSchema,
+    SearchKind,
+)
+from src.services import SearchRepository
+
+
+class SearchController:
+    def __init__(self, search_repository: SearchRepository = Depends()):
+        self.__search_repository = search_repository
+
+    async def autocomplete(self, payload: AutocompleteQuery) -> AutocompleteSchema:
+        term = payload.q.strip()
+        if not term:
+            return AutocompleteSchema(q=payload.q, items=[])
+        kinds = [payload.kind] if payload.kind else list(SearchKind)
+        rows = await self.__search_repository.autocomplete(
+            term, kinds, limit=payload.limit
+        )
+        return AutocompleteSchema(
+            q=payload.q,
+            items=[AutocompleteItemSchema.model_validate(row) for row in rows],
+        )
@@ -0,0 +1,62 @@
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy import Row, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.session import get_db_session
+from src.models import Ingredient, Meal, User
+from src.schemas.search_schemas import SearchKind
+from src.utils.search import fuzzy_match, similarity, starts_with
+
+
+class SearchRepository:
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.__session = session
+
+    @staticmethod
+    def _matches(kind: SearchKind, term: str, limit: int):
+        if kind is SearchKind.MEAL:
+            model, columns, label = Meal, [Meal.name], Meal.name
+        elif kind is SearchKind.INGREDIENT:
+            model, columns, label = Ingredient, [Ingredient.name], Ingredient.name
+        else:
+            model = User
+            columns = [User.first_name, User.last_name, User.email]
+            label = User.first_name + " " + User.last_name
+        prefix = starts_with(columns, term)
+        score = similarity(columns, term)
+        return (
+            select(
+                literal(kind.value).label("kind"),
+                model.id.label("id"),
+                label.label("label"),
+                score.label("score"),
+                prefix.label("prefix"),
+            )
+            .where(fuzzy_match(columns, term))
+            .order_by(prefix.desc(), score.desc(), model.id)
+            .limit(limit)
+        )
+
+    async def autocomplete(
+        self, term: str, kinds: Sequence[SearchKind], limit: int = 10
+    ) -> Sequence[Row]:
+        """Best ``limit`` matches over ``kinds``: prefix matches first, then
+        by trigram similarity. Each kind is cut to ``limit`` by its own index
+        scan before the candidates are merged in one statement."""
+        candidates = union_all(
+            *(select(self._matches(kind, term, limit).subquery()) for kind in kinds)
+        ).subquery()
+        query = (
+            select(
+                candidates.c.kind,
+                candidates.c.id,
+                candidates.c.label,
+                candidates.c.score,
+            )
+            .order_by(candidates.c.prefix.desc(), candidates.c.score.desc())
+            .limit(limit)
+        )
+        result = await self.__session.execute(query)
+        return result.all()
@@ -0,0 +1,41 @@
+from fastapi import Depends, HTTPException, status
+
+from src.schemas.transaction_schemas import (
+    TransactionListQuery,
+    TransactionListSchema,
+    TransactionReadSchema,
+)
+from src.services import IngredientRepository, TransactionRepository
+
+
+class TransactionController:
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository = Depends(),
+        ingredient_repository: IngredientRepository = Depends(),
+    ):
+        self.__transaction_repository = transaction_repository
+        self.__ingredient_repository = ingredient_repository
+
+    async def get_ingredient_transactions(
+        self, ingredient_id: int, payload: TransactionListQuery
+    ) -> TransactionListSchema:
+        ingredient = await self.__ingredient_repository.get_ingredient(
+            ingredient_id=ingredient_id,
+        )
+        if ingredient is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ingredient not found",
+            )
+        page = await self.__transaction_repository.get_ingredient_transactions(
+            ingredient_id, cursor=payload.cursor, size=payload.size
+        )
+        return TransactionListSchema(
+            size=payload.size,
+            items=[
+                TransactionReadSchema.model_validate(transaction)
+                for transaction in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
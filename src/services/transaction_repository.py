@@ -0,0 +1,68 @@
+from decimal import Decimal
+from typing import Iterable
+
+from fastapi import Depends
+from sqlalchemy import func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.database.session import get_db_session
+from src.models import IngredientTransaction
+from src.models.transactions import TransactionType
+from src.utils.pagination import Page, paginate
+
+
+class TransactionRepository:
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.__session = session
+
+    async def record_movements(
+        self,
+        movements: Iterable[tuple[int, Decimal]],
+        /,
+        *,
+        reference_id: int | None = None,
+        note: str | None = None,
+    ) -> None:
+        """Appends one ledger row per ``(ingredient_id, delta)`` in one INSERT.
+
+        Positive deltas are written as ``IN``, negative ones as ``OUT`` with
+        the absolute quantity; zero deltas are skipped. Does not commit, so
+        the rows land in the same transaction as the quantity change.
+
+        ``happened_at`` is the database's transaction time, the clock
+        ``MealLog.served_at`` and snapshots are on too.
+        """
+        rows = [
+            {
+                "ingredient_id": ingredient_id,
+                "quantity": abs(delta),
+                "transaction_type": (
+                    TransactionType.IN if delta > 0 else TransactionType.OUT
+                ),
+                "reference_id": reference_id,
+                "note": note,
+                "happened_at": func.now(),
+            }
+            for ingredient_id, delta in movements
+            if delta
+        ]
+        if rows:
+            await self.__session.execute(insert(IngredientTransaction).values(rows))
+
+    async def get_ingredient_transactions(
+        self, ingredient_id: int, /, *, cursor: str | None = None, size: int = 10
+    ) -> Page[IngredientTransaction]:
+        """Newest first."""
+        query = select(IngredientTransaction).where(
+            IngredientTransaction.ingredient_id == ingredient_id
+        )
+        return await paginate(
+            self.__session,
+            query,
+            [IngredientTransaction.id],
+            size=size,
+            cursor=cursor,
+            descending=True,
+            with_total=False,
+        )
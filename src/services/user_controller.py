@@ -23,18 +23,20 @@ class UserController:
         return UserReadSchema.model_validate(user.to_dict())
 
     async def get_all_users(self, payload: UserListQuery) -> UserListSchema:
-        users = await self.user_repository.get_all_users(payload)
-        if not users:
+        page = await self.user_repository.get_all_users(payload)
+        if not page.items:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="There is no users yet.",
             )
         return UserListSchema(
-            total=len(users),
+            total=page.total,
             page=payload.page,
             size=payload.size,
             search=payload.search,
-            items=[UserReadSchema.model_validate(user) for user in users],
+            items=[UserReadSchema.model_validate(user) for user in page.items],
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
         )
 
     async def update_user(
@@ -1,50 +1,76 @@
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from redis.asyncio import Redis
 
-from src.models import UserOTP
+from src.config.settings import Settings, get_settings
+from src.database.redis import get_redis
 
-from src.database.session import get_db_session
+settings: Settings = get_settings()
+
+# KEYS[1] = otp hash; ARGV = code, max attempts.
+# Returns 1 when the code matched (and deletes it), 0 when it did not, -1 when
+# there is no code and -2 when this miss used up the last attempt.
+CHECK_OTP_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return -1
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return -2
+end
+return 0
+"""
 
 
 class UserOtpRepository:
-    def __init__(self, session: AsyncSession = Depends(get_db_session)):
-        self.__session = session
+    """Verification codes kept in Redis until used or ``OTP_TTL_SECONDS`` pass.
 
-    async def get_user_otp_by_user_id(self, user_id: int) -> UserOTP | None:
-        query = await self.__session.execute(
-            select(UserOTP).where(UserOTP.user_id == user_id)
-        )
-        return query.scalar_one_or_none()
+    A code and its failed attempts live in one hash per user, so issuing,
+    checking and counting attempts are each a single atomic Redis call.
+    """
+
+    def __init__(self, redis: Redis = Depends(get_redis)):
+        self.__redis = redis
+        self.__check = redis.register_script(CHECK_OTP_SCRIPT)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"otp:{user_id}"
 
     async def delete_user_otps(self, user_id: int) -> None:
-        query = await self.__session.execute(
-            select(UserOTP).where(UserOTP.user_id == user_id)
-        )
-        user_otps = query.scalars().all()
-        for user_otp in user_otps:
-            await self.__session.delete(user_otp)
-        await self.__session.commit()
-
-    async def create_user_otp(self, user_id: int, otp_code: int) -> UserOTP:
-        await self.delete_user_otps(user_id=user_id)
-        user_otp = UserOTP(user_id=user_id, otp_code=otp_code)
-        self.__session.add(user_otp)
-        await self.__session.commit()
-        await self.__session.refresh(user_otp)
-        return user_otp
+        await self.__redis.delete(self._key(user_id))
+
+    async def create_user_otp(self, user_id: int, otp_code: int) -> None:
+        """Replaces any pending code of the user, resetting the attempts."""
+        key = self._key(user_id)
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={"code": otp_code, "attempts": 0})
+            pipe.expire(key, settings.OTP_TTL_SECONDS)
+            await pipe.execute()
 
     async def check_user_otp(self, user_id: int, otp_code: int) -> bool:
-        user_otp = await self.get_user_otp_by_user_id(user_id)
-        if not user_otp:
+        result = await self.__check(
+            keys=[self._key(user_id)],
+            args=[otp_code, settings.OTP_MAX_ATTEMPTS],
+        )
+        if result == -1:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User OTP not found",
             )
-        if user_otp.otp_code != otp_code:
+        if result == -2:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Too many invalid attempts, request a new OTP code",
+            )
+        if result == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid OTP code",
             )
-        await self.delete_user_otps(user_id=user_id)
         return True
@@ -8,7 +8,7 @@ from src.services.user_repository import (
 from src.services.user_otp_repository import (
     UserOtpRepository,
 )  # Assuming repository handles data access
-from src.models.users import User, UserOTP  # Import models
+from src.models.users import User  # Import models
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -37,16 +37,14 @@ class UserOTPService:
             )
         return user
 
-    async def create_user_otp(self, user_id: int, otp_code: int) -> UserOTP:
-        """Creates a new OTP record for a given user."""
+    async def create_user_otp(self, user_id: int, otp_code: int) -> None:
+        """Stores a new OTP for a given user, replacing any pending one."""
         await self._get_user_or_404(user_id)  # Ensure user exists
-        await self.delete_user_otps(user_id)
         try:
-            user_otp = await self.__user_otp_repository.create_user_otp(
+            await self.__user_otp_repository.create_user_otp(
                 user_id=user_id, otp_code=otp_code
             )
             logger.info(f"Created OTP for user ID {user_id}.")
-            return user_otp
         except Exception as e:
             logger.error(f"Error creating OTP for user ID {user_id}: {e}")
             raise HTTPException(
@@ -54,13 +52,6 @@ class UserOTPService:
                 detail="Could not create OTP. ",
             )
 
-    async def get_valid_user_otp(self, user_id: int) -> UserOTP | None:
-        await self._get_user_or_404(user_id)
-        user_otp = await self.__user_otp_repository.get_user_otp_by_user_id(user_id)
-        if user_otp and not user_otp.is_expired():
-            return user_otp
-        return None
-
     async def delete_user_otps(self, user_id: int) -> None:
         """Deletes all OTP records associated with a user ID."""
         await self._get_user_or_404(user_id)
@@ -83,10 +74,9 @@ class UserOTPService:
 
         if is_valid:
             logger.info(f"Valid OTP provided for user ID {user_id}. Activating user.")
-            # Activate user upon successful OTP verification
+            # Activate user upon successful OTP verification; the code itself
+            # was consumed by the check.
             await self.__user_repository.activate_user(user_id)
-            # Optionally delete the used OTP
-            await self.delete_user_otps(user_id)
             return True
         else:
             logger.warning(f"Invalid or expired OTP provided for user ID {user_id}.")
@@ -1,9 +1,12 @@
 from typing import Sequence
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import Depends, HTTPException, status
 
+from src.cache.token_revocation import token_revocation
+from src.cache.user_cache import user_cache
 from src.database.session import get_db_session
 from src.models import User
 from src.schemas.users_schemas import (
@@ -11,6 +14,8 @@ from src.schemas.users_schemas import (
     UserListQuery,
     UserUpdateSchema,
 )
+from src.utils.pagination import Page, paginate
+from src.utils.search import fuzzy_match
 
 
 class UserRepository:
@@ -47,16 +52,25 @@ class UserRepository:
         self.__session.add(user)
         await self.__session.commit()
         await self.__session.refresh(user)
+        await user_cache.invalidate(user_id)
         return user
 
-    async def get_all_users(self, payload: UserListQuery) -> Sequence[User]:
-        query = (
-            select(User).offset((payload.page - 1) * payload.size).limit(payload.size)
-        )
+    async def get_all_users(self, payload: UserListQuery) -> Page[User]:
+        query = select(User)
         if payload.search:
-            query = query.where(User.first_name.ilike(f"%{payload.search}%"))
-        res = await self.__session.execute(query)
-        return res.scalars().all()
+            query = query.where(
+                fuzzy_match(
+                    [User.first_name, User.last_name, User.email], payload.search
+                )
+            )
+        return await paginate(
+            self.__session,
+            query,
+            [User.id],
+            size=payload.size,
+            page=payload.page,
+            cursor=payload.cursor,
+        )
 
     async def update_user(self, user_id: int, payload: UserUpdateSchema) -> User:
         user = await self.get_user_by_id(user_id)
@@ -68,8 +82,15 @@ class UserRepository:
         self.__session.add(user)
         await self.__session.commit()
         await self.__session.refresh(user)
+        await user_cache.invalidate(user_id)
         return user
 
+    async def set_password_hash(self, user_id: int, password_hash: str) -> None:
+        await self.__session.execute(
+            update(User).where(User.id == user_id).values(password=password_hash)
+        )
+        await self.__session.commit()
+
     async def delete_user(self, user_id: int) -> None:
         user = await self.get_user_by_id(user_id)
         if not user:
@@ -78,6 +99,22 @@ class UserRepository:
             )
         await self.__session.delete(user)
         await self.__session.commit()
+        await user_cache.invalidate(user_id)
+        await token_revocation.revoke_user(user_id)
+
+    async def change_role(self, user_id: int, role_id: int) -> User:
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        user.update(role_id=role_id)
+        self.__session.add(user)
+        await self.__session.commit()
+        await self.__session.refresh(user)
+        await user_cache.invalidate(user_id)
+        await token_revocation.revoke_user(user_id)
+        return user
 
     async def get_admin_users(self) -> Sequence[User]:
         query = await self.__session.execute(
@@ -1,2 +1,3 @@
 from src.tasks.email import send_verification_email
 from src.tasks.send_warnings import send_warnings
+from src.tasks.bulk_email import send_bulk
@@ -0,0 +1,109 @@
+import smtplib
+import threading
+import time
+from email.message import Message
+from typing import Callable
+
+from src.config.settings import Settings, get_settings
+from src.tasks.celery_app import celery
+from src.tasks.send_warnings import build_low_stock_digest, build_warning
+from src.tasks.smtp_pool import smtp_pool
+
+settings: Settings = get_settings()
+
+# Templates send_bulk can render; each takes the recipient and the context.
+TEMPLATES: dict[str, Callable[..., Message]] = {
+    "low_stock_digest": build_low_stock_digest,
+    "warning": build_warning,
+}
+
+
+class TokenBucket:
+    """Allows ``rate`` messages per second with bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def provider_bucket(host: str) -> TokenBucket:
+    """The rate limiter of one SMTP provider, shared by this process."""
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(
+                settings.SMTP_RATE_PER_SECOND, settings.SMTP_RATE_BURST
+            )
+        return _buckets[host]
+
+
+@celery.task
+def send_bulk(
+    template: str,
+    recipients: list[str],
+    context: dict | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, str]:
+    """Renders ``template`` for every recipient and sends it in chunks.
+
+    Each chunk goes over one pooled connection, which is handed back between
+    chunks so single-message tasks are not starved. Returns ``"sent"`` or the
+    error for every recipient.
+    """
+    build = TEMPLATES[template]
+    context = context or {}
+    chunk_size = chunk_size or settings.SMTP_BULK_CHUNK_SIZE
+    bucket = provider_bucket(smtp_pool.host)
+    results: dict[str, str] = {}
+
+    pending = list(dict.fromkeys(recipients))
+    reconnected = False
+    while pending:
+        chunk, pending = pending[:chunk_size], pending[chunk_size:]
+        try:
+            with smtp_pool.connection() as server:
+                for email in chunk:
+                    bucket.acquire()
+                    try:
+                        server.send_message(build(email, **context))
+                    except (
+                        smtplib.SMTPResponseException,
+                        smtplib.SMTPRecipientsRefused,
+                    ) as e:
+                        results[email] = f"error: {e}"
+                    else:
+                        results[email] = "sent"
+            reconnected = False
+        except smtplib.SMTPServerDisconnected as e:
+            pending = [email for email in chunk if email not in results] + pending
+            # One fresh connection per drop; a second drop in a row is final.
+            if reconnected:
+                results.update({email: f"error: {e}" for email in pending})
+                break
+            reconnected = True
+        except Exception as e:
+            for email in chunk:
+                results.setdefault(email, f"error: {e}")
+            print(f"Error sending bulk email: {e}")
+    return results
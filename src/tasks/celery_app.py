@@ -10,6 +10,7 @@ celery = Celery(
     include=[
         "src.tasks.email",
         "src.tasks.send_warnings",
+        "src.tasks.bulk_email",
     ],  # ✅ import path ham to‘g‘rilandi
 )
 
@@ -1,37 +1,28 @@
-import smtplib
-from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 from src.config.settings import Settings, get_settings
 from src.tasks.celery_app import celery
-from src.tasks.email_template import EMAIL_TEMPLATE_FOR_CODE
+from src.tasks.smtp_pool import smtp_pool
+from src.tasks.email_template import VERIFICATION_EMAIL
 
 
 settings: Settings = get_settings()
 
 
-@celery.task
-def send_verification_email(email: str, code: int):
-    sender_email = settings.EMAIL
-    sender_password = settings.EMAIL_PASSWORD
-
-    html_body = EMAIL_TEMPLATE_FOR_CODE.replace("{{CODE}}", str(code)).replace(
-        "{{EMAIL}}", str(email)
+def build_verification_email(email: str, code: int) -> MIMEMultipart:
+    return VERIFICATION_EMAIL.build(
+        sender=settings.EMAIL,
+        to=email,
+        html_values={"CODE": code, "EMAIL": email},
     )
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = f"Your verification code: {code}"
-    msg["From"] = sender_email
-    msg["To"] = email
 
-    html_part = MIMEText(html_body, "html")
-    msg.attach(html_part)
+@celery.task
+def send_verification_email(email: str, code: int):
+    msg = build_verification_email(email, code)
 
     try:
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
+        smtp_pool.send_message(msg)
         return True
     except Exception as e:
         print(f"Error: {e}")
@@ -1,3 +1,5 @@
+from src.tasks.templating import CompiledTemplate, EmailTemplate
+
 EMAIL_TEMPLATE_FOR_CODE = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -169,3 +171,137 @@ EMAIL_TEMPLATE_FOR_WARNINGS = """<!DOCTYPE html>
 </body>
 </html>
 """
+
+EMAIL_TEMPLATE_FOR_LOW_STOCK_DIGEST = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>Low Stock Alert</title>
+  <style>
+    /* Reset */
+    body, table, td, p { margin:0; padding:0; }
+    img { border:0; display:block; }
+
+    /* Base */
+    body { background-color: #f9f9f9; font-family: Arial, sans-serif; }
+    .wrapper { width:100%; table-layout: fixed; background-color: #f9f9f9; padding: 20px 0; }
+    .container { max-width:600px; margin:0 auto; background-color:#ffffff; border-radius:8px; overflow:hidden; }
+    .header { background-color: #d9534f; color:#ffffff; text-align:center; padding:25px; }
+    .header h2 { font-size:20px; margin:0; }
+    .content { padding:30px; color:#444444; font-size:16px; line-height:1.6; }
+    .items { width:100%; border-collapse:collapse; margin-top:15px; font-size:14px; }
+    .items th { text-align:left; border-bottom:2px solid #d9534f; padding:8px; }
+    .items td { border-bottom:1px solid #eeeeee; padding:8px; }
+    .button { display:inline-block; padding:10px 20px; background-color:#d9534f; color:#ffffff; text-decoration:none; border-radius:4px; margin-top:20px; }
+    .footer { background-color:#f1f1f1; color:#777777; font-size:12px; text-align:center; padding:15px 30px; }
+    .footer a { color:#d9534f; text-decoration:none; }
+
+    /* Responsive */
+    @media only screen and (max-width: 600px) {
+      .header, .content, .footer { padding:20px !important; }
+      .content { font-size:14px !important; }
+    }
+  </style>
+</head>
+<body>
+  <table class="wrapper" role="presentation" width="100%">
+    <tr>
+      <td align="center">
+        <table class="container" role="presentation" width="100%">
+          <tr>
+            <td class="header">
+              <h2>⚠️ Low Stock Alert</h2>
+            </td>
+          </tr>
+          <tr>
+            <td class="content">
+              <p>Hello,</p>
+              <p>{{COUNT}} product(s) are running low in our warehouse stock:</p>
+              <table class="items" role="presentation">
+                <tr><th>Product</th><th>In stock</th><th>Minimum</th></tr>
+                {{ROWS}}
+              </table>
+              <p>Please restock them as soon as possible to avoid any interruptions.</p>
+              <a href="https://jasurbek.ru" class="button">View Inventory</a>
+            </td>
+          </tr>
+          <tr>
+            <td class="footer">
+              <p>This is an automated message—please do not reply.</p>
+              <p>Questions? Contact us at <a href="mailto:shermatovjasur800@gmail.com">shermatovjasur800@gmail.com</a>.</p>
+            </td>
+          </tr>
+        </table>
+      </td>
+    </tr>
+  </table>
+</body>
+</html>
+"""
+
+EMAIL_TEMPLATE_FOR_LOW_STOCK_ROW = (
+    "<tr><td>{{NAME}}</td><td>{{QUANTITY}} {{UNIT}}</td>"
+    "<td>{{MIN_THRESHOLD}} {{UNIT}}</td></tr>"
+)
+
+EMAIL_TEXT_FOR_CODE = """Verification Code
+
+Hello!
+We received a request to verify your email address: {{EMAIL}}
+
+Your verification code is: {{CODE}}
+
+This is an automated message - please do not reply.
+"""
+
+EMAIL_TEXT_FOR_WARNINGS = """Low Stock Alert
+
+Hello,
+The product {{PRODUCT_NAME}} is running low in our warehouse stock.
+Please restock it as soon as possible to avoid any interruptions.
+
+View Inventory: https://jasurbek.ru
+
+This is an automated message - please do not reply.
+"""
+
+EMAIL_TEXT_FOR_LOW_STOCK_DIGEST = """Low Stock Alert
+
+Hello,
+{{COUNT}} product(s) are running low in our warehouse stock:
+
+{{ROWS}}
+Please restock them as soon as possible to avoid any interruptions.
+
+View Inventory: https://jasurbek.ru
+
+This is an automated message - please do not reply.
+"""
+
+EMAIL_TEXT_FOR_LOW_STOCK_ROW = (
+    "- {{NAME}}: {{QUANTITY}} {{UNIT}} (minimum {{MIN_THRESHOLD}} {{UNIT}})\n"
+)
+
+VERIFICATION_EMAIL = EmailTemplate(
+    "Your verification code: {{CODE}}",
+    EMAIL_TEMPLATE_FOR_CODE,
+    EMAIL_TEXT_FOR_CODE,
+)
+
+LOW_STOCK_WARNING_EMAIL = EmailTemplate(
+    "⚠️ Low Stock Alert: {{PRODUCT_NAME}}",
+    EMAIL_TEMPLATE_FOR_WARNINGS,
+    EMAIL_TEXT_FOR_WARNINGS,
+    cache_parts=True,
+)
+
+LOW_STOCK_DIGEST_EMAIL = EmailTemplate(
+    "⚠️ Low Stock Alert: {{COUNT}} product(s)",
+    EMAIL_TEMPLATE_FOR_LOW_STOCK_DIGEST,
+    EMAIL_TEXT_FOR_LOW_STOCK_DIGEST,
+    cache_parts=True,
+)
+
+LOW_STOCK_ROW_HTML = CompiledTemplate(EMAIL_TEMPLATE_FOR_LOW_STOCK_ROW)
+LOW_STOCK_ROW_TEXT = CompiledTemplate(EMAIL_TEXT_FOR_LOW_STOCK_ROW, escape=False)
@@ -1,11 +1,19 @@
 import logging
+from datetime import datetime, timezone
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
+from time import time
+from typing import Any, Awaitable, Callable
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from redis.exceptions import RedisError
 
 from src.config.settings import get_settings
+from src.database.redis import get_redis
 from src.routers.ingredients_router import low_stock_ingredients
+from src.routers.inventory_router import take_inventory_snapshot
+from src.routers.report_router import build_monthly_report
 
 
 logging.basicConfig(level=logging.INFO)
@@ -14,18 +22,77 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 scheduler = AsyncIOScheduler()
 
+LOW_STOCK_SECONDS = 60 * 60 * 3
+# Interval jobs count from here rather than from each worker's boot, so every
+# worker fires on the same wall-clock ticks.
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def once_per_period(
+    job_id: str, job: Callable[[], Awaitable[Any]], period_seconds: int
+) -> Callable[[], Awaitable[None]]:
+    """Runs ``job`` in only one of the workers that schedule it.
+
+    Every uvicorn worker starts its own scheduler, so each tick fires once per
+    worker. The tick claims a Redis key named after its wall-clock slot of
+    ``period_seconds``, and only the worker that gets it runs the job, no
+    matter when the workers started. Should Redis be unreachable the job runs
+    anyway, as all of them tolerate a duplicate run.
+    """
+
+    async def run() -> None:
+        slot = int(time() // period_seconds)
+        try:
+            claimed = await get_redis().set(
+                f"schedule:{job_id}:{slot}", "1", nx=True, ex=period_seconds
+            )
+        except RedisError as e:
+            logger.warning(f"Claiming scheduled job {job_id} failed: {e}")
+            claimed = True
+        if claimed:
+            await job()
+
+    return run
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     scheduler.add_job(
-        low_stock_ingredients,
-        trigger=IntervalTrigger(seconds=60 * 60 * 3),
+        once_per_period(
+            "low_stock_every_minute", low_stock_ingredients, LOW_STOCK_SECONDS
+        ),
+        trigger=IntervalTrigger(seconds=LOW_STOCK_SECONDS, start_date=EPOCH),
         id="low_stock_every_minute",
         replace_existing=True,
         misfire_grace_time=30,
         coalesce=True,
         max_instances=1,
     )
+    scheduler.add_job(
+        # Slots of a day: the cron fires once in it, on every worker alike.
+        once_per_period("monthly_report", build_monthly_report, 60 * 60 * 24),
+        trigger=CronTrigger(day=1, hour=0, minute=15),
+        id="monthly_report",
+        replace_existing=True,
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+        max_instances=1,
+    )
+    scheduler.add_job(
+        once_per_period(
+            "inventory_snapshot",
+            take_inventory_snapshot,
+            settings.INVENTORY_SNAPSHOT_SECONDS,
+        ),
+        trigger=IntervalTrigger(
+            seconds=settings.INVENTORY_SNAPSHOT_SECONDS, start_date=EPOCH
+        ),
+        id="inventory_snapshot",
+        replace_existing=True,
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+        max_instances=1,
+    )
     logger.info("Starting scheduler…")
     scheduler.start()
 
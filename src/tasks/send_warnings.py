@@ -1,39 +1,64 @@
-import smtplib
-from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 
-from src.tasks.email_template import EMAIL_TEMPLATE_FOR_WARNINGS
+from src.tasks.email_template import (
+    LOW_STOCK_DIGEST_EMAIL,
+    LOW_STOCK_ROW_HTML,
+    LOW_STOCK_ROW_TEXT,
+    LOW_STOCK_WARNING_EMAIL,
+)
+from src.tasks.templating import Markup
 
 
 from src.config.settings import Settings, get_settings
 from src.tasks.celery_app import celery
+from src.tasks.smtp_pool import smtp_pool
 
 settings: Settings = get_settings()
 
 
-@celery.task
-def send_warnings(email: str, product_name: str):
-    sender_email = settings.EMAIL
-    sender_password = settings.EMAIL_PASSWORD
+def build_warning(email: str, product_name: str) -> MIMEMultipart:
+    return LOW_STOCK_WARNING_EMAIL.build(
+        sender=settings.EMAIL,
+        to=email,
+        html_values={"PRODUCT_NAME": product_name},
+    )
+
 
-    html_body = EMAIL_TEMPLATE_FOR_WARNINGS.replace(
-        "{{PRODUCT_NAME}}", product_name
-    ).replace("{{EMAIL}}", email)
+def build_low_stock_digest(email: str, items: list[dict]) -> MIMEMultipart:
+    """One email listing every ingredient in ``items``.
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = f"⚠️ Low Stock Alert: {product_name}"
-    msg["From"] = sender_email
-    msg["To"] = email
+    Each item has ``name``, ``quantity``, ``min_threshold`` and ``unit``.
+    """
+    rows = [
+        {
+            "NAME": item["name"],
+            "QUANTITY": item["quantity"],
+            "MIN_THRESHOLD": item["min_threshold"],
+            "UNIT": item["unit"],
+        }
+        for item in items
+    ]
+    return LOW_STOCK_DIGEST_EMAIL.build(
+        sender=settings.EMAIL,
+        to=email,
+        html_values={
+            "COUNT": len(items),
+            "ROWS": Markup("".join(LOW_STOCK_ROW_HTML.render(**row) for row in rows)),
+        },
+        text_values={
+            "COUNT": len(items),
+            "ROWS": "".join(LOW_STOCK_ROW_TEXT.render(**row) for row in rows),
+        },
+    )
 
-    html_part = MIMEText(html_body, "html")
-    msg.attach(html_part)
+
+@celery.task
+def send_warnings(email: str, product_name: str):
+    msg = build_warning(email, product_name)
 
     try:
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
+        smtp_pool.send_message(msg)
         return True
     except Exception as e:
         print(f"Error sending warning email: {e}")
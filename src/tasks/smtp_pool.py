@@ -0,0 +1,157 @@
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+from typing import Iterator
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from src.config.settings import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+class SMTPPoolTimeout(Exception):
+    """No connection became free within the pool timeout."""
+
+
+class SMTPPool:
+    """Authenticated SMTP connections shared by the tasks of one process.
+
+    At most ``size`` connections exist at once; callers beyond that wait up to
+    ``timeout`` seconds for one to be returned and then get ``SMTPPoolTimeout``,
+    so a burst of tasks queues up instead of opening a login per message.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        use_tls: bool = True,
+        size: int = 4,
+        timeout: float = 30,
+        max_idle_seconds: float = 60,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: deque[tuple[smtplib.SMTP, float]] = deque()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            self._close(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        now = time.monotonic()
+        server = None
+        expired = []
+        with self._lock:
+            while self._idle:
+                candidate, returned_at = self._idle.pop()
+                if now - returned_at <= self.max_idle_seconds:
+                    server = candidate
+                    break
+                # Providers drop idle sessions; don't pay for finding out.
+                expired.append(candidate)
+        # QUIT can take the whole socket timeout, so it goes out unlocked.
+        for stale in expired:
+            self._close(stale)
+        return server if server is not None else self._connect()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise SMTPPoolTimeout(
+                f"No SMTP connection to {self.host} free after {self.timeout}s"
+            )
+        server = None
+        try:
+            server = self._checkout()
+            yield server
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # The session is still usable after a rejected message.
+            raise
+        except (smtplib.SMTPServerDisconnected, OSError):
+            if server is not None:
+                server.close()
+                server = None
+            raise
+        except Exception:
+            if server is not None:
+                self._close(server)
+                server = None
+            raise
+        finally:
+            if server is not None:
+                with self._lock:
+                    self._idle.append((server, time.monotonic()))
+            self._slots.release()
+
+    def send_message(self, msg: Message) -> None:
+        """Sends ``msg``, reconnecting once if the pooled session was dropped."""
+        try:
+            with self.connection() as server:
+                server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            with self.connection() as server:
+                server.send_message(msg)
+
+    def reset(self, *, close: bool = True) -> None:
+        """Empties the pool, ending the idle sessions unless ``close`` is off.
+
+        After a fork the inherited sockets belong to the parent, so a child
+        drops them without sending QUIT.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        if close:
+            for server, _ in idle:
+                self._close(server)
+
+
+smtp_pool = SMTPPool(
+    settings.SMTP_SERVER,
+    settings.SMTP_PORT,
+    settings.EMAIL,
+    settings.EMAIL_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    size=settings.SMTP_POOL_SIZE,
+    timeout=settings.SMTP_POOL_TIMEOUT,
+    max_idle_seconds=settings.SMTP_POOL_MAX_IDLE_SECONDS,
+)
+
+
+@worker_process_init.connect
+def _reset_after_fork(**kwargs) -> None:
+    smtp_pool.reset(close=False)
+
+
+@worker_process_shutdown.connect
+def _close_on_shutdown(**kwargs) -> None:
+    smtp_pool.reset()
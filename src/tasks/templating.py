@@ -0,0 +1,90 @@
+import html
+import re
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from functools import lru_cache
+
+PLACEHOLDER = re.compile(r"\{\{([A-Z_]+)\}\}")
+
+
+class Markup(str):
+    """A value that is already safe HTML and is inserted as is."""
+
+
+class CompiledTemplate:
+    """A template split once into literal text and ``{{NAME}}`` placeholders.
+
+    Rendering joins the literals with the values instead of scanning the
+    whole source once per placeholder.
+    """
+
+    def __init__(self, source: str, *, escape: bool = True):
+        parts = PLACEHOLDER.split(source)
+        self._literals = parts[0::2]
+        self._names = parts[1::2]
+        self.escape = escape
+
+    @property
+    def placeholders(self) -> frozenset[str]:
+        return frozenset(self._names)
+
+    def _value(self, value) -> str:
+        if not self.escape or isinstance(value, Markup):
+            return str(value)
+        return html.escape(str(value))
+
+    def render(self, **values) -> str:
+        missing = self.placeholders - values.keys()
+        if missing:
+            raise KeyError(f"Missing template values: {', '.join(sorted(missing))}")
+        pieces = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:]):
+            pieces.append(self._value(values[name]))
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=256)
+def _cached_part(body: str, subtype: str) -> MIMEText:
+    return MIMEText(body, subtype, "utf-8")
+
+
+class EmailTemplate:
+    """Subject, HTML body and plain-text alternative of one kind of email.
+
+    With ``cache_parts`` the encoded body parts are reused whenever the same
+    body is rendered again, e.g. one digest sent to every admin. Leave it off
+    for bodies carrying secrets such as verification codes.
+    """
+
+    def __init__(
+        self, subject: str, html_body: str, text_body: str, *, cache_parts=False
+    ):
+        self.subject = CompiledTemplate(subject, escape=False)
+        self.html = CompiledTemplate(html_body)
+        self.text = CompiledTemplate(text_body, escape=False)
+        self.cache_parts = cache_parts
+
+    def _part(self, body: str, subtype: str) -> MIMEText:
+        if self.cache_parts:
+            return _cached_part(body, subtype)
+        return MIMEText(body, subtype, "utf-8")
+
+    def build(
+        self,
+        *,
+        sender: str,
+        to: str,
+        html_values: dict,
+        text_values: dict | None = None,
+    ) -> MIMEMultipart:
+        """``text_values`` default to ``html_values``; the subject uses them too."""
+        text_values = html_values if text_values is None else text_values
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = self.subject.render(**text_values)
+        msg["From"] = sender
+        msg["To"] = to
+        # Clients show the last alternative they support, so HTML goes last.
+        msg.attach(self._part(self.text.render(**text_values), "plain"))
+        msg.attach(self._part(self.html.render(**html_values), "html"))
+        return msg
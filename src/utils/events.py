@@ -0,0 +1,95 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from redis.exceptions import RedisError
+
+from src.config.settings import Settings, get_settings
+from src.database.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+
+class EventBus:
+    """Fan-out of small JSON events between the app's workers.
+
+    Events go through Redis pub/sub so every worker hears about changes made
+    by the others. With ``EVENTS_BACKEND=memory``, or while Redis is
+    unreachable, they are delivered to the subscribers of this process only.
+
+    ``subscribe`` returns once Redis has confirmed the subscription, so a
+    subscriber that then reads the current state misses no later change. It
+    stops waiting after ``SUBSCRIBE_TIMEOUT`` seconds should Redis be down.
+    """
+
+    SUBSCRIBE_TIMEOUT = 5
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self._queues: set[asyncio.Queue] = set()
+        self._listener: asyncio.Task | None = None
+        self._subscribed = asyncio.Event()
+
+    @property
+    def _use_redis(self) -> bool:
+        return settings.EVENTS_BACKEND == "redis"
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        if self._use_redis:
+            try:
+                await get_redis().publish(self.channel, json.dumps(event))
+                return
+            except RedisError as e:
+                logger.warning(f"Publishing to {self.channel} failed: {e}")
+        self._dispatch(event)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.add(queue)
+        try:
+            if self._use_redis:
+                if self._listener is None or self._listener.done():
+                    self._subscribed.clear()
+                    self._listener = asyncio.create_task(self._listen())
+                try:
+                    await asyncio.wait_for(
+                        self._subscribed.wait(), timeout=self.SUBSCRIBE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Subscribing to {self.channel} timed out")
+            yield queue
+        finally:
+            self._queues.discard(queue)
+            if not self._queues and self._listener is not None:
+                self._listener.cancel()
+                self._listener = None
+
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        for queue in self._queues:
+            queue.put_nowait(event)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            self._subscribed.set()
+                        elif message["type"] == "message":
+                            self._dispatch(json.loads(message["data"]))
+            except RedisError as e:
+                self._subscribed.clear()
+                logger.warning(f"Lost subscription to {self.channel}: {e}")
+                await asyncio.sleep(1)
+
+
+stock_events = EventBus("warehouse:stock")
+# {"kind": "meal" | "ingredient", "id": ..., "name": ...}; name is None once deleted.
+# {"kind": "recipe", "id": meal_id} when ingredients are added to or removed from a meal.
+catalog_events = EventBus("catalog:names")
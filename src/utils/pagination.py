@@ -0,0 +1,180 @@
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, Table, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.config.settings import Settings, get_settings
+
+settings: Settings = get_settings()
+
+T = TypeVar("T")
+
+# table name -> (expires at, planner estimate or None)
+_row_estimates: dict[str, tuple[float, int | None]] = {}
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_estimated: bool = False
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _load(key: InstrumentedAttribute, value: Any) -> Any:
+    """The cursor value of ``key``, checked against the column's type."""
+    if isinstance(value, dict) and set(value) == {"dt"}:
+        value = datetime.fromisoformat(value["dt"])
+    python_type = key.type.python_type
+    if not isinstance(value, python_type) or (
+        isinstance(value, bool) and python_type is not bool
+    ):
+        raise ValueError(f"bad cursor value for {key.key}")
+    return value
+
+
+def encode_cursor(keys: Sequence[InstrumentedAttribute], values: Sequence[Any]) -> str:
+    """An opaque token pointing just past the row with the given key values."""
+    payload = {"k": [key.key for key in keys], "v": [_dump(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(keys: Sequence[InstrumentedAttribute], cursor: str) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["k"] != [key.key for key in keys]:
+            raise ValueError("cursor belongs to another listing")
+        if not isinstance(payload["v"], list) or len(payload["v"]) != len(keys):
+            raise ValueError("cursor does not match the keys")
+        return [_load(key, value) for key, value in zip(keys, payload["v"])]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        )
+
+
+async def estimate_rows(session: AsyncSession, table: Table) -> int | None:
+    """Row count of ``table`` as last seen by ANALYZE, cached for a while.
+
+    ``None`` when the table has not been analyzed yet.
+    """
+    now = time.monotonic()
+    cached = _row_estimates.get(table.fullname)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    reltuples = await session.scalar(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table.fullname},
+    )
+    estimate = int(reltuples) if reltuples is not None and reltuples >= 0 else None
+    _row_estimates[table.fullname] = (
+        now + settings.PAGINATION_ESTIMATE_TTL_SECONDS,
+        estimate,
+    )
+    return estimate
+
+
+async def _estimated_total(session: AsyncSession, query: Select) -> int | None:
+    """The estimate for an unfiltered listing of a large table, else ``None``."""
+    if query.whereclause is not None:
+        return None
+    froms = query.get_final_froms()
+    if len(froms) != 1 or not isinstance(froms[0], Table):
+        return None
+    estimate = await estimate_rows(session, froms[0])
+    if estimate is None or estimate < settings.PAGINATION_ESTIMATE_THRESHOLD:
+        return None
+    return estimate
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select,
+    keys: Sequence[InstrumentedAttribute],
+    *,
+    size: int,
+    page: int = 1,
+    cursor: str | None = None,
+    descending: bool = False,
+    with_total: bool = True,
+) -> Page:
+    """Runs ``query`` for one page of entities ordered by the unique ``keys``.
+
+    With a ``cursor`` the page starts right after the row it points to
+    (keyset pagination); otherwise ``page`` is used as an offset. Either way
+    the result carries the cursor of the following page, so a client can
+    start with page numbers and continue with cursors. Rows inserted while
+    iterating by cursor never shift the pages, so none is skipped or repeated.
+
+    ``total`` counts every row matching ``query`` and comes back with the
+    page itself: a ``count(*) OVER ()`` column for offset pages, a scalar
+    subquery for cursor pages, where the window would only see the rows past
+    the cursor. Unfiltered listings of tables above
+    ``PAGINATION_ESTIMATE_THRESHOLD`` rows report the planner's estimate
+    instead and flag it with ``total_estimated``.
+    """
+    base = query
+    total = await _estimated_total(session, base) if with_total else None
+    estimated = total is not None
+    count_rows = with_total and not estimated
+
+    if cursor:
+        bound = tuple_(*keys)
+        values = tuple_(*decode_cursor(keys, cursor))
+        query = query.where(bound < values if descending else bound > values)
+        if count_rows:
+            query = query.add_columns(
+                select(func.count()).select_from(base.subquery()).scalar_subquery()
+            )
+    else:
+        query = query.offset((page - 1) * size)
+        if count_rows:
+            query = query.add_columns(func.count().over())
+    query = query.order_by(
+        *(key.desc() if descending else key.asc() for key in keys)
+    ).limit(size + 1)
+
+    result = await session.execute(query)
+    if count_rows:
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif cursor or page > 1:
+            # Past the last row there is nothing to carry the count.
+            total = await session.scalar(
+                select(func.count()).select_from(base.subquery())
+            )
+        else:
+            total = 0
+    else:
+        items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        last = items[-1]
+        next_cursor = encode_cursor(keys, [getattr(last, key.key) for key in keys])
+    return Page(
+        items=items,
+        next_cursor=next_cursor,
+        total=total,
+        total_estimated=estimated,
+    )
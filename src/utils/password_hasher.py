@@ -0,0 +1,99 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from src.config.settings import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+class PasswordHasher:
+    """Runs bcrypt on a small thread pool instead of the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    and the loop keeps serving other requests during a login wave. At most
+    ``max_workers`` hashes run at once and ``max_queue`` more may wait; past
+    that callers get a 503 rather than piling up behind a saturated pool.
+    """
+
+    def __init__(self, context: CryptContext, max_workers: int, max_queue: int):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-ins in progress, please retry.",
+                headers={"Retry-After": "1"},
+            )
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        future = self._executor.submit(func, *args)
+        # Counted off when the thread is done, not when the caller stops
+        # waiting: a disconnected client leaves its hash running.
+        future.add_done_callback(
+            lambda done: loop.call_soon_threadsafe(self._finished, done)
+        )
+        return await asyncio.wrap_future(future)
+
+    def _finished(self, future: Future) -> None:
+        self._pending -= 1
+        if future.cancelled() or future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(self.context.verify, password, password_hash)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """Also returns a new hash when the stored one uses outdated settings."""
+        return await self._run(self.context.verify_and_update, password, password_hash)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.max_workers,
+            "running": min(self._pending, self.max_workers),
+            "queued": max(self._pending - self.max_workers, 0),
+            "max_queue": self.max_queue,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+
+@cache
+def get_password_context() -> CryptContext:
+    # Hashes made with another work factor are flagged for a rehash on login.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+    )
+
+
+password_hasher = PasswordHasher(
+    get_password_context(),
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE,
+)
@@ -0,0 +1,37 @@
+from sqlalchemy import ColumnElement, func, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(term: str) -> str:
+    """Makes ``%`` and ``_`` typed by a user match literally in LIKE patterns."""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def fuzzy_match(columns: list[InstrumentedAttribute], term: str) -> ColumnElement:
+    """Rows where any of ``columns`` contains ``term`` or is similar to it.
+
+    Both the substring ``ILIKE`` and the ``%`` similarity operator are served
+    by the ``gin_trgm_ops`` indexes, so neither scans the whole table.
+    """
+    pattern = f"%{escape_like(term)}%"
+    return or_(
+        *(column.ilike(pattern, escape=LIKE_ESCAPE) for column in columns),
+        *(column.op("%")(term) for column in columns),
+    )
+
+
+def starts_with(columns: list[InstrumentedAttribute], term: str) -> ColumnElement:
+    pattern = f"{escape_like(term)}%"
+    return or_(*(column.ilike(pattern, escape=LIKE_ESCAPE) for column in columns))
+
+
+def similarity(columns: list[InstrumentedAttribute], term: str) -> ColumnElement:
+    """Trigram similarity (0 to 1) of the closest of ``columns`` to ``term``."""
+    scores = [func.similarity(column, term) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
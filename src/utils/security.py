@@ -1,4 +1,3 @@
-from passlib.context import CryptContext
 from fastapi import Depends
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -9,13 +8,17 @@ from secrets import randbelow
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from src.cache.token_revocation import token_revocation
+from src.cache.user_cache import user_cache
 from src.config.settings import Settings, get_settings
 from src.database.session import get_db_session
 from src.models import User
+from src.schemas.users_schemas import PrincipalSchema
 from src.services import UserRepository
+from src.utils.password_hasher import get_password_context, password_hasher
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = get_password_context()
 
 
 class JWTHandler:
@@ -49,9 +52,20 @@ class JWTHandler:
             token_type="refresh",
         )
 
-    def create_tokens(self, data: dict[str, Any]) -> dict[str, str]:
-        access = self.create_access_token(data)
-        refresh = self.create_refresh_token(data)
+    def create_tokens(
+        self,
+        data: dict[str, Any],
+        *,
+        role_id: int | None = None,
+        is_active: bool | None = None,
+    ) -> dict[str, str]:
+        claims = data.copy()
+        if role_id is not None:
+            claims["role_id"] = role_id
+        if is_active is not None:
+            claims["is_active"] = is_active
+        access = self.create_access_token(claims)
+        refresh = self.create_refresh_token(claims)
         return {"access_token": access, "refresh_token": refresh}
 
     def verify_token(self, token: str, expected_type: str = "access") -> dict[str, Any]:
@@ -71,12 +85,37 @@ class JWTHandler:
             )
         return payload
 
-    def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
+    async def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
         payload = self.verify_token(refresh_token, expected_type="refresh")
+        await self._check_not_revoked(payload)
         data = {k: v for k, v in payload.items() if k not in ("exp", "iat", "type")}
         tokens = self.create_tokens(data)
         return {"access_token": tokens["access_token"], "refresh_token": refresh_token}
 
+    async def _check_not_revoked(self, payload: dict[str, Any]) -> None:
+        if await token_revocation.is_revoked(payload.get("id"), payload.get("iat", 0)):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    async def get_current_principal(self, token: str, session) -> PrincipalSchema:
+        """Authorizes from the token's own claims, without loading the user.
+
+        Tokens issued before role claims existed fall back to the user lookup.
+        """
+        payload = self.verify_token(token)
+        if payload.get("id") is None or "role_id" not in payload:
+            user = await self.get_current_user(token, session)
+            return PrincipalSchema.model_validate(user)
+        await self._check_not_revoked(payload)
+        return PrincipalSchema(
+            id=payload["id"],
+            role_id=payload["role_id"],
+            is_active=payload.get("is_active", False),
+        )
+
     async def get_current_user(self, token: str, session) -> User:
         payload = self.verify_token(token)
         user_id = payload.get("id")
@@ -86,6 +125,9 @@ class JWTHandler:
                 detail="Invalid token payload",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        user = await user_cache.get(user_id)
+        if user is not None:
+            return user
         is_exist = await session.execute(select(User).where(User.id == user_id))
         user: User = is_exist.scalar_one_or_none()
         if user is None:
@@ -94,6 +136,7 @@ class JWTHandler:
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        await user_cache.set(user)
         return user
 
 
@@ -106,6 +149,17 @@ class Security:
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        return await password_hasher.hash(password)
+
+    @staticmethod
+    async def verify_and_update_password(
+        plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verifies off the event loop; a returned hash should replace the stored one."""
+        return await password_hasher.verify_and_update(plain_password, hashed_password)
+
     @staticmethod
     def check_password_strength(password: str) -> bool:
         if len(password) < 8:
@@ -139,3 +193,10 @@ async def get_current_user(
     session: AsyncSession = Depends(get_db_session),
 ) -> User:
     return await jwt_handler.get_current_user(token, session)
+
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db_session),
+) -> PrincipalSchema:
+    return await jwt_handler.get_current_principal(token, session)
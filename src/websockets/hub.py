@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from src.config.settings import Settings, get_settings
+from src.database.session import get_standalone_session
+from src.schemas.ingredients_schemas import IngredientReadSchema
+from src.services import IngredientRepository
+from src.utils.events import stock_events
+
+logger = logging.getLogger(__name__)
+
+settings: Settings = get_settings()
+
+# Renders the payload one client should see from the full list of ingredients.
+View = Callable[[list[dict[str, Any]]], dict[str, Any]]
+
+
+@dataclass
+class Patch:
+    version: int
+    upserts: dict[int, dict[str, Any]] = field(default_factory=dict)
+    removed: set[int] = field(default_factory=set)
+
+
+@dataclass
+class DeltaCursor:
+    """Position of a delta-mode client in the version history."""
+
+    version: int | None = None
+
+
+class WarehouseHub:
+    """Single source of warehouse state for every open dashboard socket.
+
+    The hub listens for stock-change events once per process, reloads the
+    changed ingredients with one short-lived session and pushes each client
+    its own view, but only when that view actually changed. Database load
+    depends on the rate of stock changes, not on the number of clients.
+
+    Every change that alters the state bumps ``version``; the last
+    ``HISTORY_SIZE`` changes are kept as patches so delta clients can be sent
+    only the rows that changed, including after a reconnect. Versions are
+    scoped to ``epoch``, which is new for every process.
+    """
+
+    HISTORY_SIZE = 256
+
+    def __init__(self) -> None:
+        self.epoch = uuid4().hex
+        self.version = 0
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._history: deque[Patch] = deque(maxlen=self.HISTORY_SIZE)
+        self._clients: dict[WebSocket, View | DeltaCursor] = {}
+        self._last_sent: dict[WebSocket, dict[str, Any]] = {}
+        self._task: asyncio.Task | None = None
+        self._loaded = asyncio.Event()
+
+    async def serve(self, websocket: WebSocket, view: View | DeltaCursor) -> None:
+        """Streams updates to an accepted socket until the client goes away."""
+        self._clients[websocket] = view
+        if self._task is None or self._task.done():
+            self._loaded.clear()
+            self._task = asyncio.create_task(self._run())
+        try:
+            await self._loaded.wait()
+            await self._push(websocket, view)
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._clients.pop(websocket, None)
+            self._last_sent.pop(websocket, None)
+            if not self._clients and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+    def cursor(self, epoch: str | None, since: int | None) -> DeltaCursor:
+        """A cursor resuming at ``since`` if it belongs to this process."""
+        return DeltaCursor(version=since if epoch == self.epoch else None)
+
+    async def _run(self) -> None:
+        """Applies stock events as they come and reloads everything every
+        ``WAREHOUSE_RESYNC_SECONDS``, busy or not, in case an event got lost."""
+        async with stock_events.subscribe() as events:
+            changed: set[int] | None = None
+            while True:
+                if changed is None:
+                    resync_at = monotonic() + settings.WAREHOUSE_RESYNC_SECONDS
+                try:
+                    await self._reload(changed)
+                except Exception as e:
+                    logger.error(f"Reloading warehouse state failed: {e}")
+                try:
+                    event = await asyncio.wait_for(
+                        events.get(), timeout=max(0.0, resync_at - monotonic())
+                    )
+                except asyncio.TimeoutError:
+                    changed = None
+                    continue
+                # A serving touches many rows at once; coalesce the burst.
+                await asyncio.sleep(0.2)
+                batch = [event]
+                while not events.empty():
+                    batch.append(events.get_nowait())
+                changed = set()
+                for item in batch:
+                    changed.update(item.get("ingredient_ids", ()))
+                if monotonic() >= resync_at:
+                    changed = None
+
+    async def _reload(self, ingredient_ids: set[int] | None = None) -> None:
+        """Reloads the given ingredients, or all of them when ``None``."""
+        async with get_standalone_session() as session:
+            ingredients = await IngredientRepository(session).get_stock_snapshot(
+                ingredient_ids
+            )
+        fresh = {
+            ingredient.id: IngredientReadSchema.model_validate(ingredient).model_dump()
+            for ingredient in ingredients
+        }
+        candidates = self._rows.keys() if ingredient_ids is None else ingredient_ids
+        patch = Patch(
+            version=self.version + 1,
+            upserts={
+                row_id: row
+                for row_id, row in fresh.items()
+                if self._rows.get(row_id) != row
+            },
+            removed={row_id for row_id in candidates if row_id not in fresh}
+            & self._rows.keys(),
+        )
+        if patch.upserts or patch.removed:
+            self._rows.update(patch.upserts)
+            for row_id in patch.removed:
+                del self._rows[row_id]
+            self.version = patch.version
+            self._history.append(patch)
+        self._loaded.set()
+        await asyncio.gather(
+            *(self._push(ws, view) for ws, view in list(self._clients.items()))
+        )
+
+    def _items(self) -> list[dict[str, Any]]:
+        return [self._rows[row_id] for row_id in sorted(self._rows)]
+
+    def _delta(self, cursor: DeltaCursor) -> dict[str, Any] | None:
+        if cursor.version == self.version:
+            return None
+        oldest = self._history[0].version if self._history else self.version + 1
+        if cursor.version is None or not oldest - 1 <= cursor.version < self.version:
+            payload = {
+                "type": "snapshot",
+                "epoch": self.epoch,
+                "version": self.version,
+                "items": self._items(),
+            }
+        else:
+            upserts: dict[int, dict[str, Any]] = {}
+            removed: set[int] = set()
+            for patch in self._history:
+                if patch.version <= cursor.version:
+                    continue
+                for row_id in patch.removed:
+                    upserts.pop(row_id, None)
+                    removed.add(row_id)
+                removed.difference_update(patch.upserts)
+                upserts.update(patch.upserts)
+            payload = {
+                "type": "patch",
+                "epoch": self.epoch,
+                "from_version": cursor.version,
+                "version": self.version,
+                "upserts": list(upserts.values()),
+                "removed": sorted(removed),
+            }
+        cursor.version = self.version
+        return payload
+
+    async def _push(self, websocket: WebSocket, view: View | DeltaCursor) -> None:
+        if isinstance(view, DeltaCursor):
+            payload = self._delta(view)
+            if payload is None:
+                return
+        else:
+            payload = view(self._items())
+            if self._last_sent.get(websocket) == payload:
+                return
+            self._last_sent[websocket] = payload
+        try:
+            await websocket.send_json(payload)
+        except Exception as e:
+            logger.info(f"Dropping warehouse client: {e}")
+            self._clients.pop(websocket, None)
+            self._last_sent.pop(websocket, None)
+
+
+warehouse_hub = WarehouseHub()
@@ -1,8 +1,9 @@
-from fastapi import WebSocket, WebSocketDisconnect, APIRouter, Depends
-import asyncio
+from typing import Any, Literal
 
-from src.schemas.ingredients_schemas import IngredientListQuery
-from src.services.ingredient_controller import IngredientController
+from fastapi import WebSocket, APIRouter, Depends
+
+from src.schemas.ingredients_schemas import IngredientListQuery, IngredientListSchema
+from src.websockets.hub import warehouse_hub
 
 router = APIRouter(
     prefix="/ws/warehouse",
@@ -10,42 +11,58 @@ router = APIRouter(
 )
 
 
+def paginate(
+    items: list[dict[str, Any]], params: IngredientListQuery
+) -> IngredientListSchema:
+    start = (params.page - 1) * params.size
+    page = items[start : start + params.size]
+    return IngredientListSchema(
+        total=len(items),
+        page=params.page,
+        size=params.size,
+        items=page,
+        search=params.search,
+    )
+
+
 @router.websocket("/warnings/")
-async def warehouse_state(
+async def warehouse_warnings(
     websocket: WebSocket,
     params: IngredientListQuery = Depends(),
-    ingredient_controller: IngredientController = Depends(),
 ):
     await websocket.accept()
 
-    try:
-        while True:
-            low_stocks = await ingredient_controller.low_stock_ingredients(
-                params.size, params.page
-            )
-            await websocket.send_json(low_stocks.model_dump())
-            await asyncio.sleep(3)
-    except WebSocketDisconnect:
-        return
-    except Exception as e:
-        await websocket.send_json({"error": str(e)})
-        await websocket.close(code=1011)
+    def view(items: list[dict[str, Any]]) -> dict[str, Any]:
+        low_stocks = [i for i in items if i["quantity"] <= i["min_threshold"]]
+        return paginate(low_stocks, params).model_dump()
+
+    await warehouse_hub.serve(websocket, view)
 
 
 @router.websocket("/state/")
 async def warehouse_state(
     websocket: WebSocket,
     params: IngredientListQuery = Depends(),
-    ingredient_controller: IngredientController = Depends(),
+    mode: Literal["full", "delta"] = "full",
+    since: int | None = None,
+    epoch: str | None = None,
 ):
+    """Streams the warehouse state.
+
+    In ``full`` mode the requested page is re-sent whenever it changes. In
+    ``delta`` mode the whole warehouse is sent once as a versioned snapshot,
+    followed by patches holding only the changed rows; reconnect with the
+    last ``epoch`` and ``version`` seen as ``epoch``/``since`` to resume.
+    """
     await websocket.accept()
-    try:
-        while True:
-            all_state = await ingredient_controller.get_all_ingredients(payload=params)
-            await websocket.send_json(all_state.model_dump())
-            await asyncio.sleep(2)
-    except WebSocketDisconnect:
+    if mode == "delta":
+        await warehouse_hub.serve(websocket, warehouse_hub.cursor(epoch, since))
         return
-    except Exception as e:
-        await websocket.send_json({"error": str(e)})
-        await websocket.close(code=1011)
+
+    def view(items: list[dict[str, Any]]) -> dict[str, Any]:
+        if params.search:
+            search = params.search.lower()
+            items = [i for i in items if search in i["name"].lower()]
+        return paginate(items, params).model_dump()
+
+    await warehouse_hub.serve(websocket, view)
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+# Settings need these; the tests below never reach Postgres, Redis or SMTP.
+for name, value in {
+    "API_V1_STR": "/api/v1",
+    "BASE_URL": "http://localhost:8000",
+    "PROJECT_NAME": "KinderGarden",
+    "PROJECT_DESCRIPTION": "tests",
+    "PROJECT_VERSION": "test",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DATABASE": "kindergarden",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "SECRET_KEY": "test-secret",
+    "EMAIL": "kitchen@example.com",
+    "EMAIL_PASSWORD": "secret",
+    "SMTP_SERVER": "localhost",
+    "APP_PORT": "8000",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
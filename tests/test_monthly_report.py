@@ -0,0 +1,80 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.inventory_repository import InventoryRepository
+from src.services.report_repository import ReportRepository, remaining_portions
+
+SOUP, PORRIDGE = 1, 2
+MILK, OATS, CARROT = 10, 11, 12
+
+RECIPES = {
+    SOUP: {MILK: Decimal("0.2"), CARROT: Decimal("0.1")},
+    PORRIDGE: {MILK: Decimal("0.3"), OATS: Decimal("0.05")},
+}
+
+
+def test_shared_stock_is_counted_once():
+    stock = {MILK: Decimal(10), OATS: Decimal(100), CARROT: Decimal(100)}
+    # Alone, 10 l of milk make 50 soups or 33 porridges; not both.
+    remaining = remaining_portions(stock, RECIPES, {SOUP: 1, PORRIDGE: 1})
+    assert remaining == 40  # 10 / ((0.2 + 0.3) / 2)
+
+
+def test_month_mix_weights_the_need():
+    stock = {MILK: Decimal(10), OATS: Decimal(100), CARROT: Decimal(100)}
+    assert remaining_portions(stock, RECIPES, {SOUP: 3, PORRIDGE: 1}) == 44
+
+
+def test_nothing_served_uses_an_even_mix_and_missing_stock_is_zero():
+    assert remaining_portions({MILK: Decimal(10)}, RECIPES, {}) == 0
+    assert remaining_portions({}, {}, {}) == 0
+
+
+@pytest.mark.anyio
+async def test_closed_month_uses_stock_at_month_end(monkeypatch):
+    requested_at = []
+
+    async def get_stock_as_of(self, at):
+        requested_at.append(at)
+        return [
+            SimpleNamespace(id=MILK, quantity=Decimal(10)),
+            SimpleNamespace(id=OATS, quantity=Decimal(100)),
+            SimpleNamespace(id=CARROT, quantity=Decimal(100)),
+        ]
+
+    async def served_by_meal(self, start, end):
+        assert (start.isoformat(), end.isoformat()) == ("2026-03-01", "2026-04-01")
+        return {SOUP: 30, PORRIDGE: 30}
+
+    async def recipes(self):
+        return RECIPES
+
+    stored = {}
+
+    async def store(self, year, month, served, possible, difference):
+        stored.update(
+            year=year,
+            month=month,
+            served=served,
+            possible=possible,
+            difference=difference,
+        )
+
+    monkeypatch.setattr(InventoryRepository, "get_stock_as_of", get_stock_as_of)
+    monkeypatch.setattr(ReportRepository, "_served_by_meal", served_by_meal)
+    monkeypatch.setattr(ReportRepository, "_recipes", recipes)
+    monkeypatch.setattr(ReportRepository, "_store", store)
+
+    await ReportRepository(session=None).upsert_monthly_report(2026, 3)
+
+    assert requested_at == [datetime(2026, 3, 31, 23, 59, 59, 999999)]
+    assert stored == {
+        "year": 2026,
+        "month": 3,
+        "served": 60,
+        "possible": 100,
+        "difference": Decimal("40.00"),
+    }
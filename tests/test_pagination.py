@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from src.models import Ingredient, MealLog
+from src.utils.pagination import decode_cursor, encode_cursor
+
+LOG_KEYS = [MealLog.served_at, MealLog.id]
+
+
+def forge(payload) -> str:
+    raw = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_cursor_round_trips():
+    served_at = datetime(2026, 3, 31, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor(LOG_KEYS, [served_at, 42])
+    assert "=" not in cursor
+    assert decode_cursor(LOG_KEYS, cursor) == [served_at, 42]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        forge([1]),
+        forge({"k": ["id"]}),
+        forge({"k": ["name"], "v": [1]}),
+        forge({"k": ["id"], "v": []}),
+        forge({"k": ["id"], "v": 1}),
+        forge({"k": ["id"], "v": ["abc"]}),
+        forge({"k": ["id"], "v": [{"x": 1}]}),
+        forge({"k": ["id"], "v": [1.5]}),
+        forge({"k": ["id"], "v": [True]}),
+        forge({"k": ["id"], "v": [{"dt": "2026-03-31T00:00:00"}]}),
+    ],
+)
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor([Ingredient.id], cursor)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[1, 2], ["2026-03-31", 2], [{"dt": "yesterday"}, 2]],
+)
+def test_served_at_must_be_a_datetime(values):
+    with pytest.raises(HTTPException):
+        decode_cursor(LOG_KEYS, forge({"k": ["served_at", "id"], "v": values}))
@@ -0,0 +1,70 @@
+from time import time
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError
+
+from src.cache import token_revocation as module
+from src.cache.token_revocation import TokenRevocationList
+
+
+class FakeRedis:
+    """The two calls the revocation list makes, with ``decode_responses``."""
+
+    def __init__(self):
+        self.values = {}
+        self.down = False
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("Redis is down")
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.down:
+            raise ConnectionError("Redis is down")
+        self.values[key] = str(value)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(module, "get_redis", lambda: redis)
+    return redis
+
+
+@pytest.mark.anyio
+async def test_tokens_of_the_revocation_second_are_revoked(redis, monkeypatch):
+    monkeypatch.setattr(module, "time", lambda: 1_700_000_000.75)
+    revocations = TokenRevocationList()
+    await revocations.revoke_user(7)
+
+    # Minted earlier in the same second, possibly with the old role.
+    assert await revocations.is_revoked(7, 1_700_000_000)
+    assert await revocations.is_revoked(7, 1_699_999_999)
+    assert not await revocations.is_revoked(7, 1_700_000_001)
+    assert not await revocations.is_revoked(8, int(time()))
+
+
+@pytest.mark.anyio
+async def test_other_workers_see_the_same_cut_off(redis, monkeypatch):
+    monkeypatch.setattr(module, "time", lambda: 1_700_000_000.75)
+    await TokenRevocationList().revoke_user(7)
+
+    other_worker = TokenRevocationList()
+    assert await other_worker.is_revoked(7, 1_700_000_000)
+    assert not await other_worker.is_revoked(7, 1_700_000_001)
+
+
+@pytest.mark.anyio
+async def test_redis_outage_fails_closed(redis):
+    redis.down = True
+    revocations = TokenRevocationList()
+
+    with pytest.raises(HTTPException) as revoking:
+        await revocations.revoke_user(7)
+    assert revoking.value.status_code == 503
+
+    with pytest.raises(HTTPException) as checking:
+        await TokenRevocationList().is_revoked(7, int(time()))
+    assert checking.value.status_code == 503